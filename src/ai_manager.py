@@ -87,39 +87,41 @@ def save_works_to_database(works: List[Work]) -> int:
     logger.info(f"Saving {len(works)} works to database...")
     
     saved_count = 0
-    for work in works:
-        # Update copyright status with scheduler
-        work = scheduler.update_work_status(work)
+    # One transaction for the whole batch instead of a commit per work
+    with database.transaction():
+        for work in works:
+            # Update copyright status with scheduler
+            work = scheduler.update_work_status(work)
         
-        # Ensure topic exists in database
-        if work.topic:
-            logger.info(f"Work '{work.title}' has topic: {work.topic.name}")
-            topic = database.get_topic_by_name(work.topic.name)
-            if not topic:
-                logger.info(f"Topic '{work.topic.name}' not found in database, adding it")
-                topic = database.add_topic(work.topic.name)
-                logger.info(f"Added topic '{topic.name}' with ID: {topic.id if topic else 'None'}")
-            else:
-                logger.info(f"Found existing topic '{topic.name}' with ID: {topic.id}")
-            work.topic = topic
-        else:
-            # If work has no topic, assign a default 'Books' topic
-            logger.info(f"Work '{work.title}' has no topic, assigning default 'Books' topic")
-            topic = database.get_topic_by_name('Books')
-            if not topic:
-                topic = database.add_topic('Books')
-                logger.info(f"Added default 'Books' topic with ID: {topic.id if topic else 'None'}")
+            # Ensure topic exists in database
+            if work.topic:
+                logger.info(f"Work '{work.title}' has topic: {work.topic.name}")
+                topic = database.get_topic_by_name(work.topic.name)
+                if not topic:
+                    logger.info(f"Topic '{work.topic.name}' not found in database, adding it")
+                    topic = database.add_topic(work.topic.name)
+                    logger.info(f"Added topic '{topic.name}' with ID: {topic.id if topic else 'None'}")
+                else:
+                    logger.info(f"Found existing topic '{topic.name}' with ID: {topic.id}")
+                work.topic = topic
             else:
-                logger.info(f"Using existing 'Books' topic with ID: {topic.id}")
-            work.topic = topic
+                # If work has no topic, assign a default 'Books' topic
+                logger.info(f"Work '{work.title}' has no topic, assigning default 'Books' topic")
+                topic = database.get_topic_by_name('Books')
+                if not topic:
+                    topic = database.add_topic('Books')
+                    logger.info(f"Added default 'Books' topic with ID: {topic.id if topic else 'None'}")
+                else:
+                    logger.info(f"Using existing 'Books' topic with ID: {topic.id}")
+                work.topic = topic
         
-        # Save work
-        saved_work = database.save_work(work)
-        if saved_work:
-            saved_count += 1
-            logger.info(f"Saved work: {saved_work.title} with topic: {saved_work.topic.name if saved_work.topic else 'None'}")
-        else:
-            logger.warning(f"Failed to save work: {work.title}")
+            # Save work
+            saved_work = database.save_work(work)
+            if saved_work:
+                saved_count += 1
+                logger.info(f"Saved work: {saved_work.title} with topic: {saved_work.topic.name if saved_work.topic else 'None'}")
+            else:
+                logger.warning(f"Failed to save work: {work.title}")
     
     logger.info(f"Successfully saved {saved_count} out of {len(works)} works")
     return saved_count
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import date, datetime
 from typing import Optional, List, Literal, Dict
 
@@ -42,6 +43,14 @@ class Author:
             life_span = f" ({birth}-{death})"
         return f"{self.name}{life_span}"
 
+    @cached_property
+    def display_line(self) -> str:
+        """Markdown line used when listing the author in work details (computed once per instance)."""
+        birth = f" (Born: {self.birth_date})" if self.birth_date else ""
+        death = f" (Died: {self.death_date})" if self.death_date else ""
+        nationality = f", {self.nationality}" if self.nationality else ""
+        return f"**{self.name}**{birth}{death}{nationality}"
+
 @dataclass
 class Work:
     """Represents a creative work."""
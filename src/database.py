@@ -2,6 +2,7 @@ import sqlite3
 import logging
 import os
 import threading
+import time
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime
 from contextlib import contextmanager
@@ -14,39 +15,109 @@ logger = logging.getLogger(__name__)
 # Thread-local storage for database connections
 _local = threading.local()
 
+# Keep IN (...) lists below SQLite's default bound-parameter limit
+_MAX_IN_PARAMS = 500
+
+# Tables whose changes bump data_version (everything except the ai_cache itself)
+_VERSIONED_TABLES = ("jurisdictions", "copyright_rules", "topics", "authors", "works",
+                     "work_authors", "work_jurisdiction_status")
+
+# sqlite3 caches prepared statements per connection, keyed by SQL text.
+# Hot-path queries are kept as constants so every call reuses the same text.
+_STATEMENT_CACHE_SIZE = 256
+_WORKS_BY_AUTHOR_SQL = """
+    SELECT w.* FROM works w
+    JOIN work_authors wa ON w.id = wa.work_id
+    WHERE wa.author_id = ?
+    ORDER BY w.title
+"""
+_INSERT_WORK_SQL = """
+    INSERT INTO works (
+        title, topic_id, creation_date, first_publication_date,
+        source_url, scraped_timestamp, copyright_expiry_date,
+        primary_jurisdiction_id, status, is_collaborative,
+        original_language, original_publisher, description
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_WORKS_BY_TOPIC_SQL = """
+    SELECT w.* FROM works w
+    JOIN topics t ON w.topic_id = t.id
+    WHERE t.name = ?
+"""
+
+def _open_connection() -> sqlite3.Connection:
+    """Opens a connection to DATABASE_PATH configured for concurrent UI access."""
+    conn = sqlite3.connect(DATABASE_PATH, timeout=20.0,  # Increased timeout
+                           cached_statements=_STATEMENT_CACHE_SIZE)
+    # WAL lets readers run while another connection writes; NORMAL sync is safe with WAL
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def close_connection():
+    """Closes this thread's pooled connection, if any."""
+    conn = getattr(_local, 'connection', None)
+    if conn is not None:
+        conn.close()
+    _local.connection = None
+    _local.depth = 0
+
 @contextmanager
 def get_connection():
     """
     Context manager for database connections.
-    Creates or reuses connections per thread and handles commit/rollback automatically.
+    Each thread keeps one open connection that is reused across calls.
+    Handles commit/rollback automatically; nested uses run inside a savepoint,
+    so only the outermost block commits.
     """
-    # Initialize connection for this thread if it doesn't exist
-    if not hasattr(_local, 'connection'):
-        _local.connection = None
+    # (Re)open this thread's connection if it has none or the database path changed
+    if getattr(_local, 'connection', None) is None or _local.path != DATABASE_PATH:
+        close_connection()
+        _local.connection = _open_connection()
+        _local.path = DATABASE_PATH
+    conn = _local.connection
+    
+    # Every block starts from the default row factory; the caller's is restored on exit
+    previous_row_factory = conn.row_factory
+    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
     
-    # Create a new connection if we don't have one
-    new_connection = False
-    if _local.connection is None:
-        _local.connection = sqlite3.connect(DATABASE_PATH, timeout=20.0)  # Increased timeout
-        _local.connection.row_factory = sqlite3.Row  # Return rows as dictionaries
-        new_connection = True
+    savepoint = None
+    if _local.depth > 0:
+        savepoint = f"nested_{_local.depth}"
+        conn.execute(f"SAVEPOINT {savepoint}")
+    _local.depth += 1
     
     try:
         # Yield the connection to the caller
-        yield _local.connection
+        yield conn
         # If we got here without an exception, commit any changes
-        _local.connection.commit()
+        if not savepoint:
+            conn.commit()
+        elif conn.in_transaction:
+            conn.execute(f"RELEASE {savepoint}")
     except Exception as e:
         # On exception, roll back any changes
-        if _local.connection:
-            _local.connection.rollback()
-            logger.error(f"Database error, rolling back: {e}")
+        if not savepoint:
+            conn.rollback()
+        elif conn.in_transaction:
+            conn.execute(f"ROLLBACK TO {savepoint}")
+            conn.execute(f"RELEASE {savepoint}")
+        logger.error(f"Database error, rolling back: {e}")
         raise
     finally:
-        # Close the connection if we created a new one
-        if new_connection and _local.connection:
-            _local.connection.close()
-            _local.connection = None
+        _local.depth -= 1
+        conn.row_factory = previous_row_factory
+
+@contextmanager
+def transaction():
+    """
+    Groups several database calls into one transaction with a single commit.
+    Calls made inside the block reuse this thread's connection.
+    """
+    with get_connection() as conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        yield conn
 
 def dict_factory(cursor, row):
     """Convert SQLite rows to dictionaries for easier handling."""
@@ -57,8 +128,9 @@ def dict_factory(cursor, row):
 
 def init_db():
     """Initializes the database and creates tables if they don't exist."""
-    # Ensure data directory exists
-    os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
+    # Ensure data directory exists (nothing to create for ":memory:")
+    if os.path.dirname(DATABASE_PATH):
+        os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
     
     logger.info(f"Initializing database at {DATABASE_PATH}")
     try:
@@ -164,6 +236,32 @@ def init_db():
                 )
             ''')
             
+            # Create ai_cache table for persisted LLM responses
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS ai_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    ts REAL NOT NULL
+                )
+            ''')
+            
+            # Single-row counter bumped by triggers on every data change, whichever
+            # process makes it; cached AI answers are keyed on it
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS data_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    version INTEGER NOT NULL
+                )
+            ''')
+            cursor.execute('INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0)')
+            for table in _VERSIONED_TABLES:
+                for event in ("INSERT", "UPDATE", "DELETE"):
+                    cursor.execute(f'''
+                        CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_data_version
+                        AFTER {event} ON {table}
+                        BEGIN UPDATE data_version SET version = version + 1 WHERE id = 1; END
+                    ''')
+            
             # Add indexes for frequent queries
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_works_expiry ON works (copyright_expiry_date)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_works_status ON works (status)')
@@ -227,10 +325,6 @@ def get_all_topics() -> List[Topic]:
         logger.info(f"Retrieved {len(topics)} topics from database")
     except sqlite3.Error as e:
         logger.error(f"Database error retrieving all topics: {e}")
-    finally:
-        # Reset row_factory if it was changed within the connection context
-        if 'conn' in locals() and conn:
-             conn.row_factory = sqlite3.Row # Or whatever the default was
     return topics
 
 def get_topic_by_id(topic_id: int) -> Optional[Topic]:
@@ -247,9 +341,6 @@ def get_topic_by_id(topic_id: int) -> Optional[Topic]:
     except sqlite3.Error as e:
         logger.error(f"Database error retrieving topic ID {topic_id}: {e}")
         return None
-    finally:
-        if 'conn' in locals() and conn:
-            conn.row_factory = sqlite3.Row
 
 def get_all_authors() -> List[Author]:
     """Retrieves all authors from the database."""
@@ -272,9 +363,6 @@ def get_all_authors() -> List[Author]:
         logger.info(f"Retrieved {len(authors)} authors from database")
     except sqlite3.Error as e:
         logger.error(f"Database error retrieving all authors: {e}")
-    finally:
-        if 'conn' in locals() and conn:
-             conn.row_factory = sqlite3.Row
     return authors
 
 def get_author_by_id(author_id: int) -> Optional[Author]:
@@ -298,9 +386,6 @@ def get_author_by_id(author_id: int) -> Optional[Author]:
     except sqlite3.Error as e:
         logger.error(f"Database error retrieving author ID {author_id}: {e}")
         return None
-    finally:
-        if 'conn' in locals() and conn:
-             conn.row_factory = sqlite3.Row
              
 def get_or_save_author(author: Author) -> Optional[Author]:
     """Saves an author to the database if they don't exist, or retrieves them if they do."""
@@ -376,8 +461,86 @@ def get_or_save_author(author: Author) -> Optional[Author]:
         logger.error(f"Database error saving author '{author.name}': {e}")
         return None
 
+def get_or_save_authors_bulk(authors: List[Author]) -> List[Optional[Author]]:
+    """
+    Batched get_or_save_author: looks up all names with one query and inserts the
+    missing authors with a single executemany. Existing authors keep their stored
+    values; only their missing dates/nationality are filled in.
+    Returns the saved authors in input order (None for authors without a name).
+    """
+    names = list(dict.fromkeys(a.name for a in authors if a.name))
+    if not names:
+        return [None] * len(authors)
+    
+    def _row_values(author: Author):
+        return (
+            author.birth_date.isoformat() if author.birth_date else None,
+            author.death_date.isoformat() if author.death_date else None,
+            author.nationality,
+        )
+    
+    def _fetch_by_name(cursor) -> Dict[str, Author]:
+        found = {}
+        for i in range(0, len(names), _MAX_IN_PARAMS):
+            chunk = names[i:i + _MAX_IN_PARAMS]
+            cursor.execute(
+                f'SELECT id, name, birth_date, death_date, nationality FROM authors WHERE name IN ({_in_clause(chunk)})',
+                chunk
+            )
+            for row in cursor.fetchall():
+                found[row[1]] = Author(
+                    id=row[0],
+                    name=row[1],
+                    birth_date=_parse_db_date(row[2]),
+                    death_date=_parse_db_date(row[3]),
+                    nationality=row[4]
+                )
+        return found
+    
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            existing = _fetch_by_name(cursor)
+            
+            # First occurrence of each name wins
+            by_name: Dict[str, Author] = {}
+            for author in authors:
+                if author.name and author.name not in by_name:
+                    by_name[author.name] = author
+            
+            missing = [a for name, a in by_name.items() if name not in existing]
+            if missing:
+                cursor.executemany(
+                    'INSERT INTO authors (name, birth_date, death_date, nationality) VALUES (?, ?, ?, ?)',
+                    [(a.name, *_row_values(a)) for a in missing]
+                )
+            
+            updates = [
+                (*_row_values(a), existing[name].id)
+                for name, a in by_name.items()
+                if name in existing and any(new and not old for new, old in zip(
+                    (a.birth_date, a.death_date, a.nationality),
+                    (existing[name].birth_date, existing[name].death_date, existing[name].nationality)))
+            ]
+            if updates:
+                cursor.executemany(
+                    'UPDATE authors SET birth_date = COALESCE(birth_date, ?), death_date = COALESCE(death_date, ?), nationality = COALESCE(nationality, ?) WHERE id = ?',
+                    updates
+                )
+            
+            if missing or updates:
+                existing = _fetch_by_name(cursor)
+            return [existing.get(a.name) if a.name else None for a in authors]
+    
+    except sqlite3.Error as e:
+        logger.error(f"Database error saving {len(names)} authors: {e}")
+        return [None] * len(authors)
+
 def save_work(work: Work) -> Optional[Work]:
-    """Saves a Work object to the database with all related data."""
+    """
+    Saves a Work object to the database with all related data.
+    Returns the same Work with its id and related IDs set, or None on failure.
+    """
     if not work.title:
         logger.warning("Cannot save work with empty title")
         return None
@@ -484,14 +647,7 @@ def save_work(work: Work) -> Optional[Work]:
                 logger.debug(f"Updated work ID: {work_id}")
             else:
                 # Insert new work
-                cursor.execute('''
-                    INSERT INTO works (
-                        title, topic_id, creation_date, first_publication_date,
-                        source_url, scraped_timestamp, copyright_expiry_date,
-                        primary_jurisdiction_id, status, is_collaborative,
-                        original_language, original_publisher, description
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(_INSERT_WORK_SQL, (
                     work.title, topic_id, creation_date_str, first_publication_date_str,
                     work.source_url, scraped_timestamp_str, expiry_date_str,
                     primary_jurisdiction_id, work.status, is_collaborative_int,
@@ -537,15 +693,148 @@ def save_work(work: Work) -> Optional[Work]:
                         set_work_copyright_status_by_jurisdiction(work_id, jur_id, status, 
                                                                   work.copyright_expiry_date)
             
-            # Now fetch the complete saved work with its ID and relationships
-            saved_work = get_work_by_id(work_id, conn)
+            # Return the caller's object with its database IDs filled in instead of
+            # re-reading the row; use get_work_by_id() when the stored copy is needed
+            work.id = work_id
+            if work.authors:
+                work.authors = saved_authors
+            if work.topic and topic_id:
+                work.topic.id = topic_id
+            if work.primary_jurisdiction and primary_jurisdiction_id:
+                work.primary_jurisdiction.id = primary_jurisdiction_id
+            if work.scraped_timestamp is None:
+                work.scraped_timestamp = datetime.fromisoformat(scraped_timestamp_str)
             
-            return saved_work
+            return work
             
     except sqlite3.Error as e:
         logger.error(f"Database error saving work '{work.title}': {e}")
         return None
 
+def save_works_bulk(works: List[Work]) -> List[Optional[Work]]:
+    """
+    Batched save_work for new works: topics, jurisdictions and authors are resolved
+    once per batch and the works are inserted with a single executemany.
+    Works that already exist (by id or source_url) are passed to save_work instead.
+    Returns the saved works in input order (None for works that could not be saved).
+    """
+    results: List[Optional[Work]] = [None] * len(works)
+    topic_ids: Dict[str, Optional[int]] = {}
+    jurisdiction_ids: Dict[Any, Optional[int]] = {}
+    
+    def _topic_id(topic: Optional[Topic]) -> Optional[int]:
+        if not topic or not topic.name:
+            return None
+        if topic.name not in topic_ids:
+            found = get_topic_by_name(topic.name) or add_topic(topic.name)
+            topic_ids[topic.name] = found.id if found else None
+        return topic_ids[topic.name]
+    
+    def _jurisdiction_id(jurisdiction: Optional[Jurisdiction]) -> Optional[int]:
+        if not jurisdiction:
+            return None
+        key = jurisdiction.id or jurisdiction.name
+        if key not in jurisdiction_ids:
+            found = next((j for j in get_all_jurisdictions()
+                          if j.id == jurisdiction.id or j.name == jurisdiction.name), None)
+            jurisdiction_ids[key] = found.id if found else None
+        return jurisdiction_ids[key]
+    
+    try:
+        with transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Existing works keep the per-row update path
+            urls = [w.source_url for w in works if w.source_url]
+            existing_urls = set()
+            for i in range(0, len(urls), _MAX_IN_PARAMS):
+                chunk = urls[i:i + _MAX_IN_PARAMS]
+                cursor.execute(f'SELECT source_url FROM works WHERE source_url IN ({_in_clause(chunk)})', chunk)
+                existing_urls.update(row[0] for row in cursor.fetchall())
+            
+            new_indexes = []
+            duplicate_indexes = []
+            new_urls = set()
+            for i, work in enumerate(works):
+                if not work.title:
+                    logger.warning("Cannot save work with empty title")
+                elif work.id or work.source_url in existing_urls:
+                    results[i] = save_work(work)
+                elif work.source_url in new_urls:
+                    # source_url is UNIQUE: later copies update the first one once it is inserted
+                    duplicate_indexes.append(i)
+                else:
+                    if work.source_url:
+                        new_urls.add(work.source_url)
+                    new_indexes.append(i)
+            if not new_indexes:
+                return results
+            new_works = [works[i] for i in new_indexes]
+            
+            # The works themselves are only updated once the batch is stored
+            saved_authors = iter(get_or_save_authors_bulk([a for w in new_works for a in w.authors]))
+            authors_by_work = [[a for a in (next(saved_authors) for _ in w.authors) if a] for w in new_works]
+            now = datetime.utcnow()
+            timestamps = [w.scraped_timestamp or now for w in new_works]
+            topic_ids_by_work = [_topic_id(w.topic) for w in new_works]
+            jurisdiction_ids_by_work = [_jurisdiction_id(w.primary_jurisdiction) for w in new_works]
+            
+            cursor.executemany(_INSERT_WORK_SQL, [
+                (
+                    work.title, topic_id,
+                    work.creation_date.isoformat() if work.creation_date else None,
+                    work.first_publication_date.isoformat() if work.first_publication_date else None,
+                    work.source_url, scraped_timestamp.isoformat(),
+                    work.copyright_expiry_date.isoformat() if work.copyright_expiry_date else None,
+                    jurisdiction_id, work.status, 1 if work.is_collaborative else 0,
+                    work.original_language, work.original_publisher, work.description
+                )
+                for work, topic_id, jurisdiction_id, scraped_timestamp
+                in zip(new_works, topic_ids_by_work, jurisdiction_ids_by_work, timestamps)
+            ])
+            # AUTOINCREMENT ids from one statement inside the write transaction are consecutive
+            cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'works'")
+            first_id = cursor.fetchone()[0] - len(new_works) + 1
+            work_ids = range(first_id, first_id + len(new_works))
+            
+            cursor.executemany(
+                'INSERT OR IGNORE INTO work_authors (work_id, author_id) VALUES (?, ?)',
+                [(work_id, a.id) for work_id, authors in zip(work_ids, authors_by_work) for a in authors if a.id]
+            )
+            
+            status_rows = [(work_id, w, code, status) for work_id, w in zip(work_ids, new_works)
+                           for code, status in w.status_by_jurisdiction.items()]
+            if status_rows:
+                cursor.execute('SELECT code, id FROM jurisdictions')
+                ids_by_code = dict(cursor.fetchall())
+                cursor.executemany(
+                    'INSERT INTO work_jurisdiction_status (work_id, jurisdiction_id, status, expiry_date) VALUES (?, ?, ?, ?)',
+                    [(work_id, ids_by_code[code], status,
+                      w.copyright_expiry_date.isoformat() if w.copyright_expiry_date else None)
+                     for work_id, w, code, status in status_rows if code in ids_by_code]
+                )
+            
+            for i in duplicate_indexes:
+                results[i] = save_work(works[i])
+            logger.debug(f"Bulk inserted {len(new_works)} works")
+        
+        for i, work, work_id, authors, topic_id, jurisdiction_id, scraped_timestamp in zip(
+                new_indexes, new_works, work_ids, authors_by_work,
+                topic_ids_by_work, jurisdiction_ids_by_work, timestamps):
+            work.id = work_id
+            work.authors = authors
+            work.scraped_timestamp = scraped_timestamp
+            if work.topic and topic_id:
+                work.topic.id = topic_id
+            if work.primary_jurisdiction and jurisdiction_id:
+                work.primary_jurisdiction.id = jurisdiction_id
+            results[i] = work
+        return results
+    
+    except sqlite3.Error as e:
+        logger.error(f"Database error bulk saving {len(works)} works: {e}")
+        return [None] * len(works)
+
 def get_work_by_title(title: str, existing_conn=None) -> Optional[Work]:
     """Retrieves a single work by its exact title."""
     logger.debug(f"Attempting to retrieve work by title: '{title}'")
@@ -702,6 +991,106 @@ def get_all_works() -> List[Work]:
         logger.error(f"Database error retrieving all works: {e}")
         return []
 
+def get_all_works_with_authors() -> List[Work]:
+    """
+    Retrieves all works with their topic and authors.
+    Topics and authors are loaded in batches through _hydrate_works, not per work.
+    """
+    works = []
+    try:
+        with get_connection() as conn:
+            conn.row_factory = dict_factory
+            cursor = conn.cursor()
+            
+            cursor.execute("SELECT * FROM works ORDER BY title, id")
+            works = list(_hydrate_works(cursor, cursor.fetchall()).values())
+            
+            logger.info(f"Retrieved {len(works)} works with authors from database")
+    
+    except sqlite3.Error as e:
+        logger.error(f"Database error retrieving all works with authors: {e}")
+    
+    return works
+
+def _count_rows(table: str) -> int:
+    """Counts the rows in a table (table name must be a trusted constant)."""
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'SELECT COUNT(*) FROM {table}')
+            return cursor.fetchone()[0]
+    except sqlite3.Error as e:
+        logger.error(f"Database error counting rows in {table}: {e}")
+        return 0
+
+def count_works() -> int:
+    """Returns the number of works in the database."""
+    return _count_rows('works')
+
+def has_any_works() -> bool:
+    """Returns True if the works table has at least one row (cheaper than count_works)."""
+    try:
+        with get_connection() as conn:
+            return conn.execute('SELECT 1 FROM works LIMIT 1').fetchone() is not None
+    except sqlite3.Error as e:
+        logger.error(f"Database error checking for works: {e}")
+        return False
+
+def count_authors() -> int:
+    """Returns the number of authors in the database."""
+    return _count_rows('authors')
+
+def count_topics() -> int:
+    """Returns the number of topics in the database."""
+    return _count_rows('topics')
+
+def count_jurisdictions() -> int:
+    """Returns the number of jurisdictions in the database."""
+    return _count_rows('jurisdictions')
+
+def count_works_by_status() -> Dict[str, int]:
+    """Returns the number of works per primary status (NULL statuses count as 'Unknown')."""
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT COALESCE(status, 'Unknown'), COUNT(*)
+                FROM works
+                GROUP BY COALESCE(status, 'Unknown')
+            ''')
+            return {row[0]: row[1] for row in cursor.fetchall()}
+    except sqlite3.Error as e:
+        logger.error(f"Database error counting works by status: {e}")
+        return {}
+
+def get_random_public_domain_works(limit: int = 5) -> List[Work]:
+    """Retrieves a random sample of works already in the public domain."""
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT id FROM works
+                WHERE status = 'Public Domain'
+                ORDER BY RANDOM()
+                LIMIT ?
+            ''', (limit,))
+            
+            work_ids = [row[0] for row in cursor.fetchall()]
+            
+            # Fetch complete works
+            works = []
+            for work_id in work_ids:
+                work = get_work_by_id(work_id, conn)
+                if work:
+                    works.append(work)
+            
+            return works
+            
+    except sqlite3.Error as e:
+        logger.error(f"Database error sampling public domain works: {e}")
+        return []
+
 def get_works_by_topic(topic_name: str) -> List[Work]:
     """Retrieves works belonging to a specific topic."""
     logger.info(f"Attempting to retrieve works for topic: '{topic_name}'")
@@ -712,67 +1101,12 @@ def get_works_by_topic(topic_name: str) -> List[Work]:
             conn.row_factory = dict_factory
             cursor = conn.cursor()
             
-            # First get the topic ID
-            cursor.execute("SELECT id FROM topics WHERE name = ?", (topic_name,))
-            topic_row = cursor.fetchone()
-            
-            if not topic_row:
-                logger.warning(f"Topic not found: {topic_name}")
-                return []
-                
-            topic_id = topic_row['id']
-            
-            # Get all works with this topic ID
-            cursor.execute("""
-                SELECT w.* FROM works w
-                WHERE w.topic_id = ?
-            """, (topic_id,))
+            # Resolve the topic and fetch its works in one query
+            cursor.execute(_WORKS_BY_TOPIC_SQL, (topic_name,))
             
             work_rows = cursor.fetchall()
-            
-            for row in work_rows:
-                # Convert row to Work object
-                work = Work(
-                    id=row['id'],
-                    title=row['title'],
-                    creation_date=_parse_db_date(row['creation_date']),
-                    first_publication_date=_parse_db_date(row['first_publication_date']),
-                    source_url=row.get('source_url'),
-                    scraped_timestamp=_parse_db_datetime(row.get('scraped_timestamp')),
-                    copyright_expiry_date=_parse_db_date(row.get('copyright_expiry_date')),
-                    status=row.get('status', 'Unknown'),
-                    is_collaborative=bool(row.get('is_collaborative', False)),
-                    original_language=row.get('original_language'),
-                    original_publisher=row.get('original_publisher'),
-                    description=row.get('description')
-                )
-                
-                # Get topic
-                cursor.execute("SELECT id, name FROM topics WHERE id = ?", (row['topic_id'],))
-                topic_row = cursor.fetchone()
-                if topic_row:
-                    work.topic = Topic(id=topic_row['id'], name=topic_row['name'])
-                
-                # Get authors for this work
-                cursor.execute("""
-                    SELECT a.* FROM authors a
-                    JOIN work_authors wa ON a.id = wa.author_id
-                    WHERE wa.work_id = ?
-                """, (row['id'],))
-                
-                author_rows = cursor.fetchall()
-                for author_row in author_rows:
-                    author = Author(
-                        id=author_row['id'],
-                        name=author_row['name'],
-                        birth_date=_parse_db_date(author_row.get('birth_date')),
-                        death_date=_parse_db_date(author_row.get('death_date')),
-                        nationality=author_row.get('nationality'),
-                        bio=author_row.get('bio')
-                    )
-                    work.authors.append(author)
-                
-                works.append(work)
+            # Topic and authors are loaded in batches rather than per work
+            works = list(_hydrate_works(cursor, work_rows).values())
             
             logger.info(f"Found {len(works)} works for topic '{topic_name}'")
     
@@ -870,85 +1204,87 @@ def add_famous_works(topic: str, works_data: List[dict]) -> int:
             logger.error(f"Failed to create topic: {topic}")
             return 0
     
-    for work_data in works_data:
-        try:
-            # Create author objects
-            authors = []
-            for author_data in work_data.get('authors', []):
-                birth_date = None
-                if 'birth_date' in author_data and author_data['birth_date']:
-                    if isinstance(author_data['birth_date'], str):
-                        birth_date = date.fromisoformat(author_data['birth_date'])
-                    else:
-                        birth_date = author_data['birth_date']
+    # Save the whole batch in one transaction; a failed work only rolls back its own savepoint
+    with transaction():
+        for work_data in works_data:
+            try:
+                # Create author objects
+                authors = []
+                for author_data in work_data.get('authors', []):
+                    birth_date = None
+                    if 'birth_date' in author_data and author_data['birth_date']:
+                        if isinstance(author_data['birth_date'], str):
+                            birth_date = date.fromisoformat(author_data['birth_date'])
+                        else:
+                            birth_date = author_data['birth_date']
                 
-                death_date = None
-                if 'death_date' in author_data and author_data['death_date']:
-                    if isinstance(author_data['death_date'], str):
-                        death_date = date.fromisoformat(author_data['death_date'])
-                    else:
-                        death_date = author_data['death_date']
+                    death_date = None
+                    if 'death_date' in author_data and author_data['death_date']:
+                        if isinstance(author_data['death_date'], str):
+                            death_date = date.fromisoformat(author_data['death_date'])
+                        else:
+                            death_date = author_data['death_date']
                 
-                nationality = author_data.get('nationality')
+                    nationality = author_data.get('nationality')
                 
-                author = Author(
-                    name=author_data['name'],
-                    birth_date=birth_date,
-                    death_date=death_date,
-                    nationality=nationality
-                )
-                authors.append(author)
+                    author = Author(
+                        name=author_data['name'],
+                        birth_date=birth_date,
+                        death_date=death_date,
+                        nationality=nationality
+                    )
+                    authors.append(author)
             
-            # Create work object
-            creation_date = None
-            if 'creation_date' in work_data and work_data['creation_date']:
-                if isinstance(work_data['creation_date'], str):
-                    creation_date = date.fromisoformat(work_data['creation_date'])
-                else:
-                    creation_date = work_data['creation_date']
+                # Create work object
+                creation_date = None
+                if 'creation_date' in work_data and work_data['creation_date']:
+                    if isinstance(work_data['creation_date'], str):
+                        creation_date = date.fromisoformat(work_data['creation_date'])
+                    else:
+                        creation_date = work_data['creation_date']
             
-            first_publication_date = None
-            if 'first_publication_date' in work_data and work_data['first_publication_date']:
-                if isinstance(work_data['first_publication_date'], str):
-                    first_publication_date = date.fromisoformat(work_data['first_publication_date'])
-                else:
-                    first_publication_date = work_data['first_publication_date']
+                first_publication_date = None
+                if 'first_publication_date' in work_data and work_data['first_publication_date']:
+                    if isinstance(work_data['first_publication_date'], str):
+                        first_publication_date = date.fromisoformat(work_data['first_publication_date'])
+                    else:
+                        first_publication_date = work_data['first_publication_date']
             
-            expiry_date = None
-            if 'copyright_expiry_date' in work_data and work_data['copyright_expiry_date']:
-                if isinstance(work_data['copyright_expiry_date'], str):
-                    expiry_date = date.fromisoformat(work_data['copyright_expiry_date'])
-                else:
-                    expiry_date = work_data['copyright_expiry_date']
-            
-            # Handle primary jurisdiction
-            primary_jurisdiction = work_data.get('primary_jurisdiction')
-            
-            work = Work(
-                title=work_data['title'],
-                authors=authors,
-                topic=topic_obj,
-                creation_date=creation_date,
-                first_publication_date=first_publication_date,
-                copyright_expiry_date=expiry_date,
-                status=work_data.get('status', 'Unknown'),
-                source_url=work_data.get('source_url'),
-                primary_jurisdiction=primary_jurisdiction
-            )
+                expiry_date = None
+                if 'copyright_expiry_date' in work_data and work_data['copyright_expiry_date']:
+                    if isinstance(work_data['copyright_expiry_date'], str):
+                        expiry_date = date.fromisoformat(work_data['copyright_expiry_date'])
+                    else:
+                        expiry_date = work_data['copyright_expiry_date']
             
-            # Update copyright status across all jurisdictions
-            work = scheduler.update_work_status(work)
+                # Handle primary jurisdiction
+                primary_jurisdiction = work_data.get('primary_jurisdiction')
             
-            # Save to database
-            saved_work = save_work(work)
-            if saved_work:
-                success_count += 1
-                logger.info(f"Added famous work: {saved_work.title}")
-            else:
-                logger.warning(f"Failed to add famous work: {work.title}")
+                work = Work(
+                    title=work_data['title'],
+                    authors=authors,
+                    topic=topic_obj,
+                    creation_date=creation_date,
+                    first_publication_date=first_publication_date,
+                    copyright_expiry_date=expiry_date,
+                    status=work_data.get('status', 'Unknown'),
+                    source_url=work_data.get('source_url'),
+                    primary_jurisdiction=primary_jurisdiction
+                )
+            
+                # Update copyright status across all jurisdictions
+                work = scheduler.update_work_status(work)
+            
+                # Save to database
+                saved_work = save_work(work)
+                if saved_work:
+                    success_count += 1
+                    logger.info(f"Added famous work: {saved_work.title}")
+                else:
+                    logger.warning(f"Failed to add famous work: {work.title}")
                 
-        except Exception as e:
-            logger.error(f"Error adding famous work {work_data.get('title', 'Unknown')}: {e}")
+            except Exception as e:
+                logger.error(f"Error adding famous work {work_data.get('title', 'Unknown')}: {e}")
     
     return success_count
 
@@ -1274,6 +1610,15 @@ def get_copyright_rules_for_jurisdiction(jurisdiction_id: int) -> List[Copyright
 
 def initialize_default_jurisdictions():
     """Initializes default jurisdictions and their copyright rules."""
+    # Nothing to do if the jurisdictions have already been seeded
+    try:
+        with get_connection() as conn:
+            if conn.execute("SELECT 1 FROM jurisdictions LIMIT 1").fetchone():
+                logger.debug("Jurisdictions already initialized, skipping defaults")
+                return
+    except sqlite3.Error as e:
+        logger.error(f"Database error checking existing jurisdictions: {e}")
+    
     # Major jurisdictions with their default rules
     jurisdictions = [
         {
@@ -1462,6 +1807,110 @@ def delete_work(work_id: int) -> bool:
         logger.error(f"Database error deleting work {work_id}: {e}")
         return False
 
+def _work_from_row(row: Dict[str, Any]) -> Work:
+    """Builds a Work (without topic or authors) from a dict row of the works table."""
+    return Work(
+        id=row['id'],
+        title=row['title'],
+        creation_date=_parse_db_date(row.get('creation_date')),
+        first_publication_date=_parse_db_date(row.get('first_publication_date')),
+        source_url=row.get('source_url'),
+        scraped_timestamp=_parse_db_datetime(row.get('scraped_timestamp')),
+        copyright_expiry_date=_parse_db_date(row.get('copyright_expiry_date')),
+        status=row.get('status', 'Unknown'),
+        is_collaborative=bool(row.get('is_collaborative', False)),
+        original_language=row.get('original_language'),
+        original_publisher=row.get('original_publisher'),
+        description=row.get('description')
+    )
+
+def _in_clause(values) -> str:
+    """Returns the placeholder list for an SQL IN clause with len(values) parameters."""
+    return ", ".join("?" * len(values))
+
+def _hydrate_works(cursor, work_rows: List[Dict[str, Any]]) -> Dict[int, Work]:
+    """
+    Builds Work objects with their topic and authors from dict rows of the works table.
+    Topics and authors are loaded with one batched query each instead of per work.
+    The cursor's connection must use dict_factory.
+    """
+    works: Dict[int, Work] = {}
+    topic_ids = set()
+    for row in work_rows:
+        if row['id'] not in works:
+            works[row['id']] = _work_from_row(row)
+            if row.get('topic_id'):
+                topic_ids.add(row['topic_id'])
+    if not works:
+        return works
+
+    topics = {}
+    topic_id_list = list(topic_ids)
+    for i in range(0, len(topic_id_list), _MAX_IN_PARAMS):
+        chunk = topic_id_list[i:i + _MAX_IN_PARAMS]
+        cursor.execute(f"SELECT id, name FROM topics WHERE id IN ({_in_clause(chunk)})", chunk)
+        for topic_row in cursor.fetchall():
+            topics[topic_row['id']] = Topic(id=topic_row['id'], name=topic_row['name'])
+    for row in work_rows:
+        if row.get('topic_id') in topics:
+            works[row['id']].topic = topics[row['topic_id']]
+
+    work_ids = list(works)
+    for i in range(0, len(work_ids), _MAX_IN_PARAMS):
+        chunk = work_ids[i:i + _MAX_IN_PARAMS]
+        cursor.execute(f"""
+            SELECT wa.work_id AS work_id, a.* FROM authors a
+            JOIN work_authors wa ON a.id = wa.author_id
+            WHERE wa.work_id IN ({_in_clause(chunk)})
+        """, chunk)
+        for author_row in cursor.fetchall():
+            works[author_row['work_id']].authors.append(Author(
+                id=author_row['id'],
+                name=author_row['name'],
+                birth_date=_parse_db_date(author_row.get('birth_date')),
+                death_date=_parse_db_date(author_row.get('death_date')),
+                nationality=author_row.get('nationality'),
+                bio=author_row.get('bio')
+            ))
+    return works
+
+def get_works_by_author_ids(author_ids: List[int]) -> Dict[int, List[Work]]:
+    """
+    Retrieves the works of several authors at once, keyed by author ID.
+    Authors without works map to an empty list.
+    """
+    works_by_author: Dict[int, List[Work]] = {author_id: [] for author_id in author_ids}
+    if not author_ids:
+        return works_by_author
+
+    try:
+        with get_connection() as conn:
+            conn.row_factory = dict_factory
+            cursor = conn.cursor()
+            
+            ids = list(works_by_author)
+            rows = []
+            for i in range(0, len(ids), _MAX_IN_PARAMS):
+                chunk = ids[i:i + _MAX_IN_PARAMS]
+                cursor.execute(f"""
+                    SELECT wa.author_id AS author_id, w.* FROM works w
+                    JOIN work_authors wa ON w.id = wa.work_id
+                    WHERE wa.author_id IN ({_in_clause(chunk)})
+                    ORDER BY w.title
+                """, chunk)
+                rows.extend(cursor.fetchall())
+            
+            works = _hydrate_works(cursor, rows)
+            for row in rows:
+                works_by_author[row['author_id']].append(works[row['id']])
+            
+            logger.info(f"Found {len(works)} works for {len(ids)} authors")
+    
+    except sqlite3.Error as e:
+        logger.error(f"Database error retrieving works for author IDs {author_ids}: {e}", exc_info=True)
+    
+    return works_by_author
+
 def get_works_by_author_id(author_id: int) -> List[Work]:
     """Retrieves works by a specific author ID."""
     logger.info(f"Retrieving works by author ID: {author_id}")
@@ -1473,60 +1922,11 @@ def get_works_by_author_id(author_id: int) -> List[Work]:
             cursor = conn.cursor()
             
             # Get all works with this author ID
-            cursor.execute("""
-                SELECT w.* FROM works w
-                JOIN work_authors wa ON w.id = wa.work_id
-                WHERE wa.author_id = ?
-                ORDER BY w.title
-            """, (author_id,))
+            cursor.execute(_WORKS_BY_AUTHOR_SQL, (author_id,))
             
             work_rows = cursor.fetchall()
-            
-            # Process each work
-            for row in work_rows:
-                # Convert row to Work object
-                work = Work(
-                    id=row['id'],
-                    title=row['title'],
-                    creation_date=_parse_db_date(row.get('creation_date')),
-                    first_publication_date=_parse_db_date(row.get('first_publication_date')),
-                    source_url=row.get('source_url'),
-                    scraped_timestamp=_parse_db_datetime(row.get('scraped_timestamp')),
-                    copyright_expiry_date=_parse_db_date(row.get('copyright_expiry_date')),
-                    status=row.get('status', 'Unknown'),
-                    is_collaborative=bool(row.get('is_collaborative', False)),
-                    original_language=row.get('original_language'),
-                    original_publisher=row.get('original_publisher'),
-                    description=row.get('description')
-                )
-                
-                # Get topic for this work
-                if row.get('topic_id'):
-                    cursor.execute("SELECT id, name FROM topics WHERE id = ?", (row['topic_id'],))
-                    topic_row = cursor.fetchone()
-                    if topic_row:
-                        work.topic = Topic(id=topic_row['id'], name=topic_row['name'])
-                
-                # Get all authors for this work (not just the requested one)
-                cursor.execute("""
-                    SELECT a.* FROM authors a
-                    JOIN work_authors wa ON a.id = wa.author_id
-                    WHERE wa.work_id = ?
-                """, (row['id'],))
-                
-                author_rows = cursor.fetchall()
-                for author_row in author_rows:
-                    author = Author(
-                        id=author_row['id'],
-                        name=author_row['name'],
-                        birth_date=_parse_db_date(author_row.get('birth_date')),
-                        death_date=_parse_db_date(author_row.get('death_date')),
-                        nationality=author_row.get('nationality'),
-                        bio=author_row.get('bio')
-                    )
-                    work.authors.append(author)
-                
-                works.append(work)
+            # Topics and all authors of each work (not just the requested one) in batched queries
+            works = list(_hydrate_works(cursor, work_rows).values())
             
             logger.info(f"Found {len(works)} works for author ID {author_id}")
     
@@ -1578,3 +1978,43 @@ def get_next_expiring_works(current_date: date, limit: int = 20) -> List[Work]:
     except sqlite3.Error as e:
         logger.error(f"Database error retrieving next expiring works: {e}")
         return []
+
+def get_data_version() -> int:
+    """Returns a counter that changes whenever the stored data changes (0 if unavailable)."""
+    try:
+        with get_connection() as conn:
+            result = conn.execute('SELECT version FROM data_version WHERE id = 1').fetchone()
+            return result[0] if result else 0
+    except sqlite3.Error as e:
+        logger.error(f"Database error reading data version: {e}")
+        return 0
+
+def get_cached_ai_response(key: str, max_age: Optional[float] = None) -> Optional[str]:
+    """
+    Retrieves a cached AI response by its key, or None if not cached.
+    With max_age (seconds), responses stored longer ago than that count as not cached.
+    """
+    min_ts = time.time() - max_age if max_age is not None else 0
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT value FROM ai_cache WHERE key = ? AND ts >= ?', (key, min_ts))
+            result = cursor.fetchone()
+            return result[0] if result else None
+    except sqlite3.Error as e:
+        logger.error(f"Database error retrieving cached AI response '{key}': {e}")
+        return None
+
+def save_cached_ai_response(key: str, value: str) -> bool:
+    """Stores an AI response in the cache, replacing any previous value for the key."""
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'INSERT OR REPLACE INTO ai_cache (key, value, ts) VALUES (?, ?, ?)',
+                (key, value, time.time())
+            )
+            return True
+    except sqlite3.Error as e:
+        logger.error(f"Database error caching AI response '{key}': {e}")
+        return False
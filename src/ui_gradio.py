@@ -1,15 +1,21 @@
 import gradio as gr
 import pandas as pd
 from datetime import date, datetime
+from collections import Counter
 
 import logging
-import sys
-import os
-import random # For showing random examples
+import logging.config
+import functools
+import inspect
+import re
 import json # For LLM context
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import hashlib # For AI cache keys
+import threading
+import asyncio
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from cachetools import LRUCache, TTLCache, cached
 
 # Import necessary project modules
 from src import database
@@ -22,65 +28,236 @@ from src.ai import answer_query_with_context # Import the AI function for queryi
 from .date_provider import get_current_date
 
 # --- Setup ---
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("gradio_ui")
 
-# Ensure database is initialized when UI starts
-try:
-    database.init_db()
-    database.initialize_default_jurisdictions()
-    logger.info("Database initialized for UI.")
-except Exception as e:
-    logger.error(f"Failed to initialize database: {e}", exc_info=True)
-    # Optionally raise or handle this error to prevent UI launch if DB fails
+LOGGING_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "root": {"level": "INFO", "handlers": ["console"]},
+}
+
+_initialized = False
+
+def startup():
+    """Initializes the database for the UI. Safe to call more than once."""
+    global _initialized
+    if _initialized:
+        return
+    try:
+        database.init_db()
+        database.initialize_default_jurisdictions()
+        _initialized = True
+        logger.info("Database initialized for UI.")
+    except Exception as e:
+        logger.error(f"Failed to initialize database: {e}", exc_info=True)
+        # Optionally raise or handle this error to prevent UI launch if DB fails
+
+# Table schemas shared by the handlers and the gr.DataFrame components
+_WORKS_COLUMNS: tuple[str, ...] = ("ID", "Title", "Authors", "Topic", "Status", "Expiry Date")
+_WORKS_DISPLAY_COLUMNS: tuple[str, ...] = _WORKS_COLUMNS + ("Days Remaining",)
+_AUTHOR_COLUMNS: tuple[str, ...] = ("ID", "Name", "Birth Date", "Death Date", "Nationality")
+_TOPIC_COLUMNS: tuple[str, ...] = ("ID", "Name")
+# Returned as-is on empty/error paths; never mutate them in place
+_EMPTY_WORKS_DF = pd.DataFrame(columns=list(_WORKS_COLUMNS))
+_EMPTY_AUTHORS_DF = pd.DataFrame(columns=list(_AUTHOR_COLUMNS))
+_EMPTY_TOPICS_DF = pd.DataFrame(columns=list(_TOPIC_COLUMNS))
+
+# Bump when the work analysis prompt changes so stale cached answers are ignored
+AI_ANALYSIS_PROMPT_VERSION = 1
+_AI_ERROR_PREFIXES = ("Error", "(Error", "Sorry, I encountered an error", "I encountered an error")
+# Cached AI answers also depend on today's date, so they expire after a day
+_AI_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# One long-lived pool for all UI background work: the dashboard's concurrent DB reads,
+# the data management jobs and Ask AI. Bounds the number of worker threads across sessions.
+_ui_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="ui-bg")
+atexit.register(_ui_executor.shutdown, wait=False)
+
+async def _run_in_background(fn, *args):
+    """Awaits a blocking call run on the shared UI executor."""
+    return await asyncio.get_running_loop().run_in_executor(_ui_executor, fn, *args)
+
+# Last (args key, response) per browser session, used by _memo_last_call
+_last_calls = LRUCache(maxsize=1024)
+
+# Short-lived caches for DB reads on the selection hot path.
+# Cleared by _invalidate_ui_caches() whenever the UI mutates the database.
+_UI_CACHE_TTL_SECONDS = 60
+_ui_cache_lock = threading.Lock()
+_author_cache = TTLCache(maxsize=512, ttl=_UI_CACHE_TTL_SECONDS)
+_works_by_author_cache = TTLCache(maxsize=512, ttl=_UI_CACHE_TTL_SECONDS)
+_author_works_display_cache = TTLCache(maxsize=256, ttl=_UI_CACHE_TTL_SECONDS)
+_topic_works_display_cache = TTLCache(maxsize=256, ttl=_UI_CACHE_TTL_SECONDS)
+_work_details_cache = TTLCache(maxsize=1024, ttl=_UI_CACHE_TTL_SECONDS)
+# Whole-tab results of the argument-free loaders (one entry each)
+_topics_tab_cache = TTLCache(maxsize=1, ttl=300)  # topics rarely change
+_dashboard_cache = TTLCache(maxsize=1, ttl=_UI_CACHE_TTL_SECONDS)
+_expirations_report_cache = TTLCache(maxsize=1, ttl=_UI_CACHE_TTL_SECONDS)
+_public_domain_report_cache = TTLCache(maxsize=1, ttl=_UI_CACHE_TTL_SECONDS)
+
+@cached(_author_cache, lock=_ui_cache_lock)
+def _cached_author(author_id: int):
+    """database.get_author_by_id, memoized for _UI_CACHE_TTL_SECONDS."""
+    return database.get_author_by_id(author_id)
+
+@cached(_works_by_author_cache, lock=_ui_cache_lock)
+def _cached_works_by_author(author_id: int):
+    """database.get_works_by_author_id, memoized for _UI_CACHE_TTL_SECONDS."""
+    return database.get_works_by_author_id(author_id)
+
+@cached(_author_works_display_cache, lock=_ui_cache_lock)
+def _formatted_works_by_author(author_id: int):
+    """Returns (display DataFrame, work count) for an author's works, memoized by author ID."""
+    works = _cached_works_by_author(author_id)
+    return format_works_for_display(works), len(works)
+
+@cached(_topic_works_display_cache, lock=_ui_cache_lock)
+def _formatted_works_by_topic(topic_name: str):
+    """Returns (display DataFrame, work count) for a topic's works, memoized by topic name."""
+    works = database.get_works_by_topic(topic_name)
+    return format_works_for_display(works), len(works)
+
+# A successful API key check is reused for 10 minutes; a failed check raises and is not cached
+_api_key_cache = TTLCache(maxsize=1, ttl=600)
+
+@cached(_api_key_cache, lock=_ui_cache_lock)
+def _validate_api_key_cached() -> bool:
+    """
+    ai_manager.validate_gemini_api_key, memoized on success.
+    Its sys.exit on a missing key is raised as RuntimeError so handlers can report it.
+    """
+    try:
+        ai_manager.validate_gemini_api_key()
+    except SystemExit:
+        raise RuntimeError("Gemini API key not set. Please add your key to the .env file.") from None
+    return True
+
+def _invalidate_ui_caches():
+    """Drops every in-process UI cache after the database has been modified."""
+    with _ui_cache_lock:
+        _author_cache.clear()
+        _works_by_author_cache.clear()
+        _author_works_display_cache.clear()
+        _topic_works_display_cache.clear()
+        _work_details_cache.clear()
+        _topics_tab_cache.clear()
+        _dashboard_cache.clear()
+        _expirations_report_cache.clear()
+        _public_domain_report_cache.clear()
+        _last_calls.clear()
 
 # --- UI Helper Functions ---
 
+def _call_key(args) -> tuple:
+    """Builds a hashable key describing handler arguments."""
+    key = []
+    for arg in args:
+        if isinstance(arg, gr.SelectData):
+            index = arg.index
+            key.append(("select", tuple(index) if isinstance(index, list) else index))
+        elif isinstance(arg, pd.DataFrame):
+            key.append(("df", arg.shape, int(pd.util.hash_pandas_object(arg, index=True).sum())))
+        elif isinstance(arg, dict):
+            # State lookups can hold whole Work lists; stand in the list length for its repr
+            key.append(("dict", tuple((k, len(v) if isinstance(v, list) else v) for k, v in arg.items())))
+        else:
+            key.append(repr(arg))
+    return tuple(key)
+
+def _memo_last_call(fn):
+    """
+    Skips re-sending a handler's outputs when they would not change for the session.
+    On identical arguments, returns gr.update() for every output so Gradio does not
+    re-serialize unchanged DataFrames. When new arguments produce an output equal to the
+    one last sent (e.g. another cell of the same row), that output alone is replaced by
+    gr.update(). Gradio injects the gr.Request used to find the session.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args):
+        request = None
+        if args and isinstance(args[-1], gr.Request):
+            request, args = args[-1], args[:-1]
+        session = getattr(request, "session_hash", None)
+        if session is None:
+            return fn(*args)
+
+        cache_key = (fn.__qualname__, session)
+        args_key = _call_key(args)
+        last = _last_calls.get(cache_key)
+        if last is not None and last[0] == args_key:
+            return tuple(gr.update() for _ in last[1]) if last[2] else gr.update()
+
+        response = fn(*args)
+        is_tuple = isinstance(response, tuple)
+        outputs = response if is_tuple else (response,)
+        output_keys = [_call_key((output,)) for output in outputs]
+        _last_calls[cache_key] = (args_key, output_keys, is_tuple)
+        if last is not None and last[2] == is_tuple and len(last[1]) == len(output_keys):
+            outputs = tuple(gr.update() if new == old else output
+                            for output, new, old in zip(outputs, output_keys, last[1]))
+            return outputs if is_tuple else outputs[0]
+        return response
+
+    signature = inspect.signature(fn)
+    request_param = inspect.Parameter("request", inspect.Parameter.POSITIONAL_OR_KEYWORD, default=None, annotation=gr.Request)
+    wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), request_param])
+    wrapper.__annotations__ = {**fn.__annotations__, "request": gr.Request}
+    return wrapper
+
+def _work_record(work: Work, today: date) -> dict:
+    """Builds the display row for a single work."""
+    expiry_date = work.copyright_expiry_date
+    days_left = (expiry_date - today).days if expiry_date and expiry_date >= today else None
+    return {
+        "ID": work.id,
+        "Title": work.title,
+        "Authors": ", ".join(a.name for a in work.authors) if work.authors else "Unknown",
+        "Topic": work.topic.name if work.topic else "N/A",
+        "Status": work.status or "Unknown",
+        "Expiry Date": expiry_date.isoformat() if expiry_date else "N/A",
+        "Days Remaining": str(days_left) if days_left is not None else "N/A",
+    }
+
 def format_works_for_display(works: list[Work]) -> pd.DataFrame:
     """Formats a list of Work objects into a Pandas DataFrame for Gradio."""
-    columns = ["ID", "Title", "Authors", "Topic", "Status", "Expiry Date", "Days Remaining"]
+    columns = list(_WORKS_DISPLAY_COLUMNS)
     if not works:
         return pd.DataFrame(columns=columns)
 
-    data = []
     today = get_current_date() # Get current date for calculating days remaining
-    for work in works:
-        authors = ", ".join(a.name for a in work.authors) if work.authors else "Unknown"
-        topic = work.topic.name if work.topic else "N/A"
-        status = work.status if work.status else "Unknown"
-        expiry = work.copyright_expiry_date.isoformat() if work.copyright_expiry_date else "N/A"
-        
-        # Calculate days remaining
-        days_left = None
-        if work.copyright_expiry_date and work.copyright_expiry_date >= today:
-            days_left = (work.copyright_expiry_date - today).days
-        days_remaining_str = str(days_left) if days_left is not None else "N/A"
-
-        data.append([work.id, work.title, authors, topic, status, expiry, days_remaining_str])
-
-    return pd.DataFrame(data, columns=columns)
+    # Build all rows first and construct the frame in a single pass
+    records = [_work_record(work, today) for work in works]
+    df = pd.DataFrame.from_records(records, columns=columns)
+    # Few distinct values repeat across rows; categories keep report tables small
+    df["Status"] = df["Status"].astype("category")
+    df["Topic"] = df["Topic"].astype("category")
+    return df
+
+def _iso_or_na(value) -> str:
+    """Formats an optional date for display tables."""
+    return value.isoformat() if value else "N/A"
 
 def format_authors_for_display(authors: list[Author]) -> pd.DataFrame:
     """Formats a list of Author objects into a Pandas DataFrame."""
     if not authors:
-        return pd.DataFrame(columns=["ID", "Name", "Birth Date", "Death Date", "Nationality"])
+        return _EMPTY_AUTHORS_DF
 
-    data = []
-    for author in authors:
-        birth = author.birth_date.isoformat() if author.birth_date else "N/A"
-        death = author.death_date.isoformat() if author.death_date else "N/A"
-        nat = author.nationality if author.nationality else "N/A"
-        data.append([author.id, author.name, birth, death, nat])
+    data = [
+        [author.id, author.name, _iso_or_na(author.birth_date), _iso_or_na(author.death_date), author.nationality or "N/A"]
+        for author in authors
+    ]
 
-    return pd.DataFrame(data, columns=["ID", "Name", "Birth Date", "Death Date", "Nationality"])
+    return pd.DataFrame(data, columns=list(_AUTHOR_COLUMNS))
 
 def format_topics_for_display(topics: list[Topic]) -> pd.DataFrame:
     """Formats a list of Topic objects into a Pandas DataFrame."""
     if not topics:
-        return pd.DataFrame(columns=["ID", "Name"])
+        return _EMPTY_TOPICS_DF
     data = [[topic.id, topic.name] for topic in topics]
-    return pd.DataFrame(data, columns=["ID", "Name"])
+    return pd.DataFrame(data, columns=list(_TOPIC_COLUMNS))
 
+@_memo_last_call
 def search_works_ui(query: str):
     """UI wrapper for searching works."""
     logger.info(f"UI: Searching works for '{query}'")
@@ -96,24 +273,30 @@ def search_works_ui(query: str):
         logger.error(f"UI Search Error: {e}", exc_info=True)
         return pd.DataFrame(), f"Error during search: {e}"
 
+def _row_lookup(items) -> dict[int, tuple[int, str]]:
+    """Maps each display row index to (ID, name); kept in gr.State for the selection handlers."""
+    return {i: (item.id, item.name) for i, item in enumerate(items)}
+
 def search_authors_ui(query: str):
     """UI wrapper for searching authors.
-       Returns: DataFrame for display, status message, DataFrame for state."""
+       Returns: DataFrame for display, status message, row index -> (author ID, name) for state,
+       and the found authors' works keyed by author ID (prefetched for the selection handler)."""
     logger.info(f"UI: Searching authors for '{query}'")
-    empty_df = pd.DataFrame(columns=["ID", "Name", "Birth Date", "Death Date", "Nationality"]) # Define empty structure
     try:
         results = database.search_authors(query) # This returns List[Author]
         if not results:
-             # Return empty DF for display, message, and empty DF for state
-             return empty_df, f"No authors found matching '{query}'.", empty_df
+             # Return empty DF for display, message, and empty state
+             return _EMPTY_AUTHORS_DF, f"No authors found matching '{query}'.", {}, {}
         # Pass List[Author] to formatter
         authors_df = format_authors_for_display(results)
-        # Return DF for display, message, and DF for state
-        return authors_df, f"Found {len(results)} authors for query '{query}'.", authors_df
+        # Prefetch every found author's works in one batch so selecting a row needs no DB access
+        author_works = database.get_works_by_author_ids([a.id for a in results])
+        # Return DF for display, message, row lookup and works for state
+        return authors_df, f"Found {len(results)} authors for query '{query}'.", _row_lookup(results), author_works
     except Exception as e:
         logger.error(f"UI Author Search Error: {e}", exc_info=True)
-        # Return empty DF for display, error message, and empty DF for state
-        return empty_df, f"Error searching authors: {e}", empty_df
+        # Return empty DF for display, error message, and empty state
+        return _EMPTY_AUTHORS_DF, f"Error searching authors: {e}", {}, {}
 
 def get_all_topics_ui():
     """UI wrapper to get all topics."""
@@ -122,12 +305,62 @@ def get_all_topics_ui():
         results = database.get_all_topics()
         if not results:
              # Return an empty DataFrame instead of None
-             return pd.DataFrame(columns=["ID", "Name"]), "No topics found in the database."
+             return _EMPTY_TOPICS_DF, "No topics found in the database."
         return format_topics_for_display(results), f"Found {len(results)} topics."
     except Exception as e:
         logger.error(f"UI Topics Error: {e}", exc_info=True)
         # Return an empty DataFrame on error
-        return pd.DataFrame(columns=["ID", "Name"]), f"Error retrieving topics: {e}"
+        return _EMPTY_TOPICS_DF, f"Error retrieving topics: {e}"
+
+@cached(_work_details_cache, lock=_ui_cache_lock)
+def _render_work_details(work_id: int):
+    """Renders the details markdown for a work, or None if it doesn't exist. Memoized by work ID."""
+    work = database.get_work_by_id(work_id)
+    if not work:
+        return None
+
+    # Build detailed information
+    details_md = f"# {work.title}\n\n"
+
+    # Authors section
+    details_md += "## Authors\n"
+    if work.authors:
+        details_md += "".join(f"- {author.display_line}\n" for author in work.authors)
+    else:
+        details_md += "- Unknown\n"
+
+    # Basic info section
+    details_md += "\n## Publication Details\n"
+    details_md += f"- **Topic:** {work.topic.name if work.topic else 'Unknown'}\n"
+    details_md += f"- **Creation Date:** {work.creation_date or 'Unknown'}\n"
+    details_md += f"- **First Publication:** {work.first_publication_date or 'Unknown'}\n"
+    details_md += f"- **Primary Status:** {work.status or 'Unknown'}\n"
+    details_md += f"- **Copyright Expiry:** {work.copyright_expiry_date or 'Unknown'}\n"
+
+    if work.description:
+        details_md += f"\n## Description\n{work.description}\n"
+
+    # Get jurisdiction-specific status
+    details_md += "\n## Status by Jurisdiction\n"
+    jurisdictions = database.get_all_jurisdictions()
+
+    for jurisdiction in jurisdictions:
+        if not jurisdiction.id or not jurisdiction.code:
+            continue # Skip if jurisdiction info is incomplete
+
+        status_info = database.get_work_copyright_status_by_jurisdiction(work.id, jurisdiction.id)
+        status = status_info.get('status', 'Unknown') if status_info else 'Unknown'
+        expiry = status_info.get('expiry_date', 'Unknown') if status_info else 'Unknown'
+
+        term_desc = f"life + {jurisdiction.term_years_after_death} years"
+        if jurisdiction.has_special_rules:
+            term_desc += " (with special rules)" # Indicate special rules
+
+        details_md += f"### {jurisdiction.name} ({term_desc})\n"
+        details_md += f"- **Status:** {status}\n"
+        details_md += f"- **Expiry Date:** {expiry}\n"
+
+    return details_md
 
 def get_work_details_ui(evt: gr.SelectData, works_df: pd.DataFrame): # Modified signature
     """UI wrapper to get detailed information about a specific work."""
@@ -137,62 +370,17 @@ def get_work_details_ui(evt: gr.SelectData, works_df: pd.DataFrame): # Modified
     selected_index = evt.index[0] # Get the row index
     try:
         # Assuming 'ID' is the first column (index 0)
-        work_id = int(works_df.iloc[selected_index, 0])
+        work_id = int(works_df.iat[selected_index, 0])
     except (IndexError, KeyError, ValueError):
          return "Could not retrieve selected work ID.", -1 # Return -1 for invalid ID
 
     logger.info(f"UI: Getting details for work ID {work_id}")
 
     try:
-        work = database.get_work_by_id(work_id)
-        if not work:
+        details_md = _render_work_details(work_id)
+        if details_md is None:
             return "Work not found.", work_id # Return ID even if not found
 
-        # Build detailed information
-        details_md = f"# {work.title}\n\n"
-
-        # Authors section
-        details_md += "## Authors\n"
-        if work.authors:
-            for author in work.authors:
-                birth = f" (Born: {author.birth_date})" if author.birth_date else ""
-                death = f" (Died: {author.death_date})" if author.death_date else ""
-                nationality = f", {author.nationality}" if author.nationality else ""
-                details_md += f"- **{author.name}**{birth}{death}{nationality}\n"
-        else:
-            details_md += "- Unknown\n"
-
-        # Basic info section
-        details_md += "\n## Publication Details\n"
-        details_md += f"- **Topic:** {work.topic.name if work.topic else 'Unknown'}\n"
-        details_md += f"- **Creation Date:** {work.creation_date or 'Unknown'}\n"
-        details_md += f"- **First Publication:** {work.first_publication_date or 'Unknown'}\n"
-        details_md += f"- **Primary Status:** {work.status or 'Unknown'}\n"
-        details_md += f"- **Copyright Expiry:** {work.copyright_expiry_date or 'Unknown'}\n"
-
-        if work.description:
-            details_md += f"\n## Description\n{work.description}\n"
-
-        # Get jurisdiction-specific status
-        details_md += "\n## Status by Jurisdiction\n"
-        jurisdictions = database.get_all_jurisdictions()
-
-        for jurisdiction in jurisdictions:
-            if not jurisdiction.id or not jurisdiction.code:
-                continue # Skip if jurisdiction info is incomplete
-
-            status_info = database.get_work_copyright_status_by_jurisdiction(work.id, jurisdiction.id)
-            status = status_info.get('status', 'Unknown') if status_info else 'Unknown'
-            expiry = status_info.get('expiry_date', 'Unknown') if status_info else 'Unknown'
-
-            term_desc = f"life + {jurisdiction.term_years_after_death} years"
-            if jurisdiction.has_special_rules:
-                term_desc += " (with special rules)" # Indicate special rules
-
-            details_md += f"### {jurisdiction.name} ({term_desc})\n"
-            details_md += f"- **Status:** {status}\n"
-            details_md += f"- **Expiry Date:** {expiry}\n"
-
         # Return details and the valid work_id
         return details_md, work_id
     except Exception as e:
@@ -200,17 +388,18 @@ def get_work_details_ui(evt: gr.SelectData, works_df: pd.DataFrame): # Modified
         # Return error message and the potentially valid ID
         return f"Error retrieving work details: {e}", work_id
 
+@_memo_last_call
 def get_works_by_topic_ui(evt, topics_df):
     """UI wrapper to get works for a specific topic ID."""
     try:
         # Check if topics_df is None or not a DataFrame or empty
         if topics_df is None or not isinstance(topics_df, pd.DataFrame) or topics_df.empty:
              logger.warning("UI: get_works_by_topic_ui called with invalid or empty topics_df.")
-             return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), "Topic data is not available. Cannot load works."
+             return _EMPTY_WORKS_DF, "Topic data is not available. Cannot load works."
         
         # Check if the event is valid (not None or empty)
         if evt is None or not hasattr(evt, 'index') or not evt.index:
-             return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), "Select a topic to view works."
+             return _EMPTY_WORKS_DF, "Select a topic to view works."
         
         # Get the selected row index
         selected_index = evt.index[0]
@@ -220,12 +409,12 @@ def get_works_by_topic_ui(evt, topics_df):
             # Check index bounds
             if selected_index >= len(topics_df):
                  logger.warning(f"UI: Selected index {selected_index} out of bounds for topics_df with length {len(topics_df)}.")
-                 return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), "Invalid selection index."
+                 return _EMPTY_WORKS_DF, "Invalid selection index."
                  
-            topic_id = int(topics_df.iloc[selected_index, 0])
+            topic_id = int(topics_df.iat[selected_index, 0])
         except (IndexError, ValueError, TypeError) as e:
              logger.error(f"UI: Error retrieving topic ID from selection. Index: {selected_index}, Df shape: {topics_df.shape}. Error: {e}", exc_info=True)
-             return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), "Could not retrieve topic ID from selection."
+             return _EMPTY_WORKS_DF, "Could not retrieve topic ID from selection."
         
         logger.info(f"UI: Getting works for topic ID {topic_id}")
         
@@ -233,7 +422,7 @@ def get_works_by_topic_ui(evt, topics_df):
         topic = database.get_topic_by_id(topic_id)
         if not topic:
              logger.warning(f"UI: Could not find topic with ID {topic_id}")
-             return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), f"Topic with ID {topic_id} not found."
+             return _EMPTY_WORKS_DF, f"Topic with ID {topic_id} not found."
              
         topic_name = topic.name
         
@@ -242,14 +431,15 @@ def get_works_by_topic_ui(evt, topics_df):
         
         # Check if results is None or empty list
         if results is None or len(results) == 0:
-             return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), f"No works found for topic '{topic_name}'."
+             return _EMPTY_WORKS_DF, f"No works found for topic '{topic_name}'."
         
         # Format and return works
         return format_works_for_display(results), f"Found {len(results)} works for topic '{topic_name}'."
     except Exception as e:
         logger.error(f"UI Works by Topic Error: {e}", exc_info=True)
-        return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), f"Error retrieving works for topic: {e}"
+        return _EMPTY_WORKS_DF, f"Error retrieving works for topic: {e}"
     
+@_memo_last_call
 def get_works_by_author_ui(evt, authors_df):
     """UI wrapper to get works for a specific author ID."""
     try:
@@ -262,7 +452,7 @@ def get_works_by_author_ui(evt, authors_df):
         
         # Get the author ID from the first column of the selected row
         try:
-            author_id = int(authors_df.iloc[selected_index, 0])
+            author_id = int(authors_df.iat[selected_index, 0])
         except (IndexError, ValueError):
             return pd.DataFrame(), "Could not retrieve author ID from selection."
             
@@ -285,106 +475,46 @@ def get_works_by_author_ui(evt, authors_df):
         logger.error(f"UI Works by Author Error: {e}", exc_info=True)
         return pd.DataFrame(), f"Error retrieving works for author: {e}"
 
-def get_ai_analysis_for_work(work_id): # Remove type hint for debugging
-    """Generate AI analysis for a specific work ID."""
-    # --- DEBUGGING ---
-    logger.info(f"UI: Entering get_ai_analysis_for_work. Received argument type: {type(work_id)}")
-    logger.info(f"UI: Received argument value: {repr(work_id)}") # Use repr for detailed value
-    # --- END DEBUGGING ---
-
-    # --- Robust ID Check ---
-    actual_work_id = None
-    if isinstance(work_id, int):
-        actual_work_id = work_id
-    elif isinstance(work_id, float): # Gradio might pass Number state as float
-        actual_work_id = int(work_id)
-    # Add checks for other potential types if necessary based on logs
-    # elif hasattr(work_id, 'value'): # Check if the state object itself was passed
-    #    if isinstance(work_id.value, (int, float)):
-    #        actual_work_id = int(work_id.value)
-
-    if actual_work_id is None:
-        logger.error(f"UI: Could not determine a valid integer work ID from input. Type: {type(work_id)}, Value: {repr(work_id)}")
-        return "Error: Could not identify the selected work ID. Please try selecting the work again."
-    # --- End Robust ID Check ---
-
-    logger.info(f"UI: Processing AI analysis for integer work ID {actual_work_id}") # Log the final ID used
-
-    # Check if a valid work ID was passed (using the validated integer ID)
-    if actual_work_id < 0: # Check for the -1 placeholder
-        return "Please select a valid work from the table first."
-
-    try:
-        # Ensure API key is configured
-        ai_manager.validate_gemini_api_key()
-
-        # Get work details using the validated integer ID
-        work = database.get_work_by_id(actual_work_id)
-        if not work:
-            # Use the validated integer ID in the error message
-            return f"Work with ID {actual_work_id} not found."
-
-        # Generate prompt about this specific work
-        prompt = f"Analyze the copyright status of '{work.title}' in different jurisdictions. "
-
-        if work.authors:
-            authors_str = ", ".join(a.name for a in work.authors)
-            prompt += f"Created by {authors_str}. "
-
-            # --- Initialize death_dates list ---
-            death_dates = []
-            # --- END Initialize death_dates list ---
-            for author in work.authors:
-                 if author.death_date:
-                    death_dates.append(f"{author.name} died on {author.death_date}")
+# --- Report Functions ---
+@cached(_expirations_report_cache, lock=_ui_cache_lock)
+def _upcoming_expirations_report():
+    """Memoized body of get_upcoming_expirations_ui. Raises on errors, so error messages are never cached."""
+    logger.info("UI: Getting nearest upcoming expirations")
+    today = get_current_date()
+    limit = 20  # Show the nearest 20 expirations
 
-            if death_dates:
-                 prompt += f"{', '.join(death_dates)}. "
+    # Get the nearest works expiring on or after today, without upper date limit
+    expiring_works = database.get_next_expiring_works(current_date=today, limit=limit)
 
-        if work.creation_date:
-            prompt += f"Created on {work.creation_date}. "
+    if not expiring_works:
+        return pd.DataFrame(), f"No upcoming copyright expirations found from {today.isoformat()} onwards."
 
-        prompt += "Explain when this work will enter the public domain in different countries, and any special considerations."
+    # Format for display
+    df_display = format_works_for_display(expiring_works)
 
-        # Get the analysis using the general AI function
-        # Pass the generated prompt string to ask_ai_about_data
-        analysis = ask_ai_about_data(prompt)
-        return analysis
-
-    except Exception as e:
-        logger.error(f"UI Work Analysis Error: {e}", exc_info=True)
-        return f"Error generating analysis for work ID {actual_work_id}: {e}"
+    return df_display, f"Showing the {len(expiring_works)} nearest upcoming copyright expirations from {today.isoformat()} onwards."
 
-# --- Report Functions ---
 def get_upcoming_expirations_ui():
     """UI wrapper for displaying the nearest upcoming expirations."""
-    logger.info("UI: Getting nearest upcoming expirations")
     try:
-        today = get_current_date()
-        limit = 20  # Show the nearest 20 expirations
-
-        # Get the nearest works expiring on or after today, without upper date limit
-        expiring_works = database.get_next_expiring_works(current_date=today, limit=limit)
-
-        if not expiring_works:
-            return pd.DataFrame(), f"No upcoming copyright expirations found from {today.isoformat()} onwards."
-
-        # Format for display
-        df_display = format_works_for_display(expiring_works)
-        
-        return df_display, f"Showing the {len(expiring_works)} nearest upcoming copyright expirations from {today.isoformat()} onwards."
+        return _upcoming_expirations_report()
     except Exception as e:
         logger.error(f"UI Expiry Report Error: {e}", exc_info=True)
         return pd.DataFrame(), f"Error generating report: {e}"
 
+@cached(_public_domain_report_cache, lock=_ui_cache_lock)
+def _public_domain_report():
+    """Memoized body of get_public_domain_ui. Raises on errors, so error messages are never cached."""
+    logger.info("UI: Getting public domain works")
+    pd_works = database.get_public_domain_works()
+    if not pd_works:
+         return pd.DataFrame(), "No works found marked as Public Domain (primary status). Database might be empty or works haven't been processed."
+    return format_works_for_display(pd_works), f"Found {len(pd_works)} public domain works."
+
 def get_public_domain_ui():
     """UI wrapper for displaying public domain works."""
-    logger.info("UI: Getting public domain works")
     try:
-        pd_works = database.get_public_domain_works()
-        if not pd_works:
-             return pd.DataFrame(), "No works found marked as Public Domain (primary status). Database might be empty or works haven't been processed."
-        return format_works_for_display(pd_works), f"Found {len(pd_works)} public domain works."
+        return _public_domain_report()
     except Exception as e:
         logger.error(f"UI PD Report Error: {e}", exc_info=True)
         return pd.DataFrame(), f"Error generating report: {e}"
@@ -433,79 +563,140 @@ def get_international_status_ui():
         return f"Error generating international report: {e}"
 
 # --- Dashboard Function ---
+@cached(_dashboard_cache, lock=_ui_cache_lock)
+def _dashboard_info():
+    """Memoized body of get_dashboard_info. Raises on errors, so error messages are never cached."""
+    # Run the independent dashboard queries concurrently; latency is the slowest query, not the sum
+    today = date.today()
+    one_year_later = date(today.year + 1, today.month, today.day)
+    futures = {
+        "works": _ui_executor.submit(database.count_works),
+        "authors": _ui_executor.submit(database.count_authors),
+        "topics": _ui_executor.submit(database.count_topics),
+        "jurisdictions": _ui_executor.submit(database.count_jurisdictions),
+        "by_status": _ui_executor.submit(database.count_works_by_status),
+        "expiring": _ui_executor.submit(database.get_works_nearing_expiry, one_year_later),
+        "pd_sample": _ui_executor.submit(database.get_random_public_domain_works, 5),
+    }
+    results = {name: future.result() for name, future in futures.items()}
+
+    count = results["works"]
+    status_md = f"## Copyright Database Overview\n\n"
+    status_md += f"The database contains **{count}** creative works.\n\n"
+
+    # Create statistics chart (aggregates only, no rows are materialized)
+    status_md += "### Statistics\n"
+    status_md += f"- **Works:** {count}\n"
+    status_md += f"- **Authors:** {results['authors']}\n"
+    status_md += f"- **Topics:** {results['topics']}\n"
+    status_md += f"- **Jurisdictions:** {results['jurisdictions']}\n\n"
+
+    # Get work status distribution
+    status_counts = Counter(results["by_status"])
+    pd_count = status_counts.get("Public Domain", 0)
+    copyrighted_count = status_counts.get("Copyrighted", 0)
+    unknown_count = sum(v for k, v in status_counts.items() if k not in {"Public Domain", "Copyrighted"})
+
+    status_md += "### Copyright Status Distribution\n"
+    status_md += f"- **Public Domain:** {pd_count} works\n"
+    status_md += f"- **Copyrighted:** {copyrighted_count} works\n"
+    status_md += f"- **Unknown Status:** {unknown_count} works\n\n"
+
+    # Create empty DataFrames for highlights
+    expiring_soon_df = pd.DataFrame()
+    pd_works_df = pd.DataFrame()
+
+    if count == 0:
+        status_md += "**Note:** Database is currently empty. Use the **Data Management** tab to add works."
+    else:
+        status_md += "### Explore the Database\n"
+        status_md += "- Use the **Browse Works** tab to search across all works\n"
+        status_md += "- Use the **Browse Authors** tab to find works by specific authors\n"
+        status_md += "- Use the **Browse Topics** tab to explore works by category\n"
+        status_md += "- Check the **Reports** tab for copyright summaries\n"
+        status_md += "- Use the **Ask AI** tab for help interpreting copyright information\n\n"
+
+        # Get expiring soon works
+        expiring_works = results["expiring"]
+
+        if expiring_works:
+            expiring_works.sort(key=lambda w: w.copyright_expiry_date or date.max)
+            expiring_soon_df = format_works_for_display(expiring_works[:5]) # Show top 5
+
+            status_md += "### 🚨 Works Expiring Soon\n"
+            status_md += f"There are **{len(expiring_works)}** works set to enter the public domain within the next year.\n"
+            status_md += "*Check the table below for details.*\n\n"
+
+        # Get some PD works
+        pd_sample = results["pd_sample"] # 5 random
+        if pd_count and pd_sample:
+            pd_works_df = format_works_for_display(pd_sample)
+
+            status_md += "### ✅ Public Domain Works\n"
+            status_md += f"There are **{pd_count}** works already in the public domain.\n"
+            status_md += "*Check the table below for a sample of these works.*\n"
+
+    return status_md, expiring_soon_df, pd_works_df
+
 def get_dashboard_info():
     """Checks the database and returns status info and highlights."""
     try:
-        all_works = database.get_all_works()
-        count = len(all_works)
-        status_md = f"## Copyright Database Overview\n\n"
-        status_md += f"The database contains **{count}** creative works.\n\n"
-
-        # Get statistics
-        topics = database.get_all_topics()
-        authors = database.get_all_authors()
-        jurisdictions = database.get_all_jurisdictions()
-
-        # Create statistics chart
-        status_md += "### Statistics\n"
-        status_md += f"- **Works:** {count}\n"
-        status_md += f"- **Authors:** {len(authors)}\n"
-        status_md += f"- **Topics:** {len(topics)}\n"
-        status_md += f"- **Jurisdictions:** {len(jurisdictions)}\n\n"
-
-        # Get work status distribution
-        pd_works = [w for w in all_works if w.status == "Public Domain"]
-        copyrighted_works = [w for w in all_works if w.status == "Copyrighted"]
-        unknown_works = [w for w in all_works if w.status not in ["Public Domain", "Copyrighted"]]
-
-        status_md += "### Copyright Status Distribution\n"
-        status_md += f"- **Public Domain:** {len(pd_works)} works\n"
-        status_md += f"- **Copyrighted:** {len(copyrighted_works)} works\n"
-        status_md += f"- **Unknown Status:** {len(unknown_works)} works\n\n"
-
-        # Create empty DataFrames for highlights
-        expiring_soon_df = pd.DataFrame()
-        pd_works_df = pd.DataFrame()
-
-        if count == 0:
-            status_md += "**Note:** Database is currently empty. Use the **Data Management** tab to add works."
-        else:
-            status_md += "### Explore the Database\n"
-            status_md += "- Use the **Browse Works** tab to search across all works\n"
-            status_md += "- Use the **Browse Authors** tab to find works by specific authors\n"
-            status_md += "- Use the **Browse Topics** tab to explore works by category\n"
-            status_md += "- Check the **Reports** tab for copyright summaries\n"
-            status_md += "- Use the **Ask AI** tab for help interpreting copyright information\n\n"
-
-            # Get expiring soon works
-            today = date.today()
-            one_year_later = date(today.year + 1, today.month, today.day)
-            expiring_works = database.get_works_nearing_expiry(one_year_later)
-
-            if expiring_works:
-                expiring_works.sort(key=lambda w: w.copyright_expiry_date or date.max)
-                expiring_soon_df = format_works_for_display(expiring_works[:5]) # Show top 5
-
-                status_md += "### 🚨 Works Expiring Soon\n"
-                status_md += f"There are **{len(expiring_works)}** works set to enter the public domain within the next year.\n"
-                status_md += "*Check the table below for details.*\n\n"
-
-            # Get some PD works
-            if pd_works:
-                pd_sample = random.sample(pd_works, min(len(pd_works), 5)) # Show 5 random
-                pd_works_df = format_works_for_display(pd_sample)
-
-                status_md += "### ✅ Public Domain Works\n"
-                status_md += f"There are **{len(pd_works)}** works already in the public domain.\n"
-                status_md += "*Check the table below for a sample of these works.*\n"
-
-        return status_md, expiring_soon_df, pd_works_df
-
+        return _dashboard_info()
     except Exception as e:
         logger.error(f"Error getting dashboard info: {e}", exc_info=True)
         return f"Error checking database status: {e}", pd.DataFrame(), pd.DataFrame()
 
 # --- AI Assistant Function ---
+def _answer_work_count(match):
+    """Answers "how many works" questions."""
+    return f"The database contains **{database.count_works()}** works."
+
+def _answer_author_count(match):
+    """Answers "how many authors" questions."""
+    return f"The database contains **{database.count_authors()}** authors."
+
+def _answer_public_domain_list(match):
+    """Lists the works marked as Public Domain."""
+    pd_works = database.get_public_domain_works()
+    if not pd_works:
+        return "No works in the database are currently marked as Public Domain."
+    lines = "\n".join(f"- {work.title}" for work in pd_works)
+    return f"There are **{len(pd_works)}** public domain works in the database:\n{lines}"
+
+def _answer_work_expiry(match):
+    """Answers expiry questions for a single, unambiguous work; otherwise defers to RAG."""
+    title = match.group("title").strip().strip("\"'")
+    work = database.get_work_by_title(title)
+    if not work:
+        matches = database.search_works(title)
+        if len(matches) != 1:
+            return None
+        work = matches[0]
+    if work.status == "Public Domain":
+        return f"**{work.title}** is already in the public domain."
+    if work.copyright_expiry_date:
+        return f"**{work.title}** is expected to enter the public domain after {work.copyright_expiry_date.isoformat()} (status: {work.status})."
+    return None
+
+# Questions answered straight from the database, checked in order before calling the LLM.
+# A handler may return None to fall back to the RAG pipeline.
+_LOCAL_ANSWERS = [
+    (re.compile(r"^\s*how many works(?: are there)?(?: in the database)?\s*\??\s*$", re.IGNORECASE), _answer_work_count),
+    (re.compile(r"^\s*how many authors(?: are there)?(?: in the database)?\s*\??\s*$", re.IGNORECASE), _answer_author_count),
+    (re.compile(r"^\s*(?:list|show)(?: all)?(?: the)? public domain works\s*\??\s*$", re.IGNORECASE), _answer_public_domain_list),
+    (re.compile(r"^\s*when (?:does|will) (?P<title>.+?) (?:expire|enter the public domain)\s*\??\s*$", re.IGNORECASE), _answer_work_expiry),
+]
+
+def _answer_locally(question: str):
+    """Returns an answer for trivial questions without the LLM, or None."""
+    for pattern, handler in _LOCAL_ANSWERS:
+        match = pattern.match(question)
+        if match:
+            answer = handler(match)
+            if answer is not None:
+                return answer
+    return None
+
 def ask_ai_about_data(question: str):
     """Handles user questions, gathers context, and queries the LLM using RAG."""
     logger.info(f"UI: AI Question Received: '{question}'")
@@ -513,14 +704,28 @@ def ask_ai_about_data(question: str):
         return "Please ask a question about copyright, author rights, or works in the database."
 
     try:
+        local_answer = _answer_locally(question)
+        if local_answer is not None:
+            logger.info("UI: Answered question from the database without the LLM")
+            return local_answer
+
+        # Identical questions against unchanged data reuse the stored answer
+        cache_key = _question_cache_key(question)
+        cached = database.get_cached_ai_response(cache_key, max_age=_AI_CACHE_MAX_AGE_SECONDS)
+        if cached is not None:
+            logger.info("UI: Using cached AI answer")
+            return cached
+
         # Ensure API key is configured
-        ai_manager.validate_gemini_api_key()
+        _validate_api_key_cached()
 
         # Import db_rag module here to avoid circular imports
         from . import db_rag
         
         # Use the RAG query system to get an answer with database context
         answer = db_rag.rag_query(question)
+        if _is_cacheable_answer(answer):
+            database.save_cached_ai_response(cache_key, answer)
         return answer
 
     except Exception as e:
@@ -535,6 +740,45 @@ def ask_ai_about_data(question: str):
             logger.error(f"UI Ask AI Fallback Error: {ai_err}", exc_info=True)
             return f"Sorry, I encountered an error trying to answer your question: {e}"
 
+def _build_work_analysis_prompt(work: Work) -> str:
+    """Builds the LLM prompt used to analyze the copyright status of a work."""
+    prompt = f"Analyze the copyright status of '{work.title}' in different jurisdictions. "
+
+    if work.authors:
+        authors = ", ".join(a.name for a in work.authors)
+        prompt += f"Created by {authors}. "
+
+        # Add death dates if available
+        death_dates = []
+        for author in work.authors:
+            if author.death_date:
+                death_dates.append(f"{author.name} died on {author.death_date}")
+
+        if death_dates:
+            prompt += f"{', '.join(death_dates)}. "
+
+    if work.creation_date:
+        prompt += f"Created on {work.creation_date}. "
+
+    prompt += "Explain when this work will enter the public domain in different countries, and any special considerations."
+    return prompt
+
+def _question_cache_key(question: str) -> str:
+    """Cache key for a free-form question, tied to the current data version."""
+    normalized = " ".join(question.lower().split())
+    question_hash = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+    data_version = database.get_data_version()
+    return f"question:v{AI_ANALYSIS_PROMPT_VERSION}:{data_version}:{question_hash}"
+
+def _work_analysis_cache_key(work: Work, prompt: str) -> str:
+    """Cache key for a work analysis. The prompt embeds the work's data, so edits invalidate it."""
+    prompt_hash = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+    return f"work_analysis:v{AI_ANALYSIS_PROMPT_VERSION}:{work.id}:{prompt_hash}"
+
+def _is_cacheable_answer(answer: str) -> bool:
+    """Error/fallback answers are returned as text; never persist those."""
+    return bool(answer) and not answer.startswith(_AI_ERROR_PREFIXES)
+
 def get_ai_analysis_for_work(work_id: int):
     """Generate AI analysis for a specific work."""
     logger.info(f"UI: Generating AI analysis for work ID {work_id}")
@@ -542,205 +786,212 @@ def get_ai_analysis_for_work(work_id: int):
         return "Please select a work to analyze."
 
     try:
-        # Ensure API key is configured
-        ai_manager.validate_gemini_api_key()
-
         # Get work details
         work = database.get_work_by_id(work_id)
         if not work:
             return "Work not found."
 
         # Generate prompt about this specific work
-        prompt = f"Analyze the copyright status of '{work.title}' in different jurisdictions. "
-
-        if work.authors:
-            authors = ", ".join(a.name for a in work.authors)
-            prompt += f"Created by {authors}. "
-
-            # Add death dates if available
-            death_dates = []
-            for author in work.authors:
-                if author.death_date:
-                    death_dates.append(f"{author.name} died on {author.death_date}")
+        prompt = _build_work_analysis_prompt(work)
 
-            if death_dates:
-                prompt += f"{', '.join(death_dates)}. "
+        # Reuse a previous analysis of the same work data if we have one
+        cache_key = _work_analysis_cache_key(work, prompt)
+        cached = database.get_cached_ai_response(cache_key, max_age=_AI_CACHE_MAX_AGE_SECONDS)
+        if cached is not None:
+            logger.info(f"UI: Using cached AI analysis for work ID {work_id}")
+            return cached
 
-        if work.creation_date:
-            prompt += f"Created on {work.creation_date}. "
-
-        prompt += "Explain when this work will enter the public domain in different countries, and any special considerations."
-
-        # Get the analysis
+        # Get the analysis (ask_ai_about_data validates the API key)
         analysis = ask_ai_about_data(prompt)
+        if _is_cacheable_answer(analysis):
+            database.save_cached_ai_response(cache_key, analysis)
         return analysis
 
     except Exception as e:
         logger.error(f"UI Work Analysis Error: {e}", exc_info=True)
         return f"Error generating analysis: {e}"
 
+@cached(_topics_tab_cache, lock=_ui_cache_lock)
+def _topics_tab():
+    """Memoized body of initialize_topics_ui. Raises on errors, so error messages are never cached."""
+    logger.info("UI: Initializing topics tab")
+    # First check if we have any topics in the database
+    topics = database.get_all_topics()
+
+    if not topics or len(topics) == 0:
+        # No topics found, let's see if we have any works with topics that weren't properly registered
+        logger.warning("No topics found in database. Checking for topics in works...")
+        all_works = database.get_all_works()
+        topic_names = set()
+        for work in all_works:
+            if work.topic and work.topic.name:
+                topic_names.add(work.topic.name)
+
+        # Add any missing topics to the database
+        for topic_name in topic_names:
+            logger.info(f"Adding missing topic: {topic_name}")
+            database.add_topic(topic_name)
+
+        # Try getting topics again
+        topics = database.get_all_topics()
+
+    # Format topics for display and return
+    topics_df = format_topics_for_display(topics)
+    message = f"Found {len(topics)} topics."
+
+    if len(topics) == 0:
+        # If we still have no topics, we need sample data
+        message = "No topics found. Use the 'Data Management' tab to add sample data."
+
+    logger.info(f"UI: Topics tab initialized with {len(topics)} topics")
+    return topics_df, message, _row_lookup(topics)
+
 def initialize_topics_ui():
     """Initialize the topics tab with data and UI elements."""
-    logger.info("UI: Initializing topics tab")
     try:
-        # First check if we have any topics in the database
-        topics = database.get_all_topics()
-        
-        if not topics or len(topics) == 0:
-            # No topics found, let's see if we have any works with topics that weren't properly registered
-            logger.warning("No topics found in database. Checking for topics in works...")
-            all_works = database.get_all_works()
-            topic_names = set()
-            for work in all_works:
-                if work.topic and work.topic.name:
-                    topic_names.add(work.topic.name)
-            
-            # Add any missing topics to the database
-            for topic_name in topic_names:
-                logger.info(f"Adding missing topic: {topic_name}")
-                database.add_topic(topic_name)
-            
-            # Try getting topics again
-            topics = database.get_all_topics()
-        
-        # Format topics for display and return
-        topics_df = format_topics_for_display(topics)
-        message = f"Found {len(topics)} topics."
-        
-        if len(topics) == 0:
-            # If we still have no topics, we need sample data
-            message = "No topics found. Use the 'Data Management' tab to add sample data."
-        
-        logger.info(f"UI: Topics tab initialized with {len(topics)} topics")
-        return topics_df, message
-        
+        return _topics_tab()
     except Exception as e:
         logger.error(f"UI Topics Initialization Error: {e}", exc_info=True)
-        empty_df = pd.DataFrame(columns=["ID", "Name"])
-        return empty_df, f"Error initializing topics: {e}"
+        return _EMPTY_TOPICS_DF, f"Error initializing topics: {e}", {}
 
 def setup_topics_tab():
     """Get the topic selection handler function."""
     # Topic selection handler
-    def topic_selection_handler(evt: gr.SelectData):
+    @_memo_last_call
+    def topic_selection_handler(evt: gr.SelectData, topic_rows: dict):
         try:
             # Check if the event has valid index information
             if not hasattr(evt, 'index') or not evt.index:
-                return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), "Please select a topic to view works."
+                return _EMPTY_WORKS_DF, "Please select a topic to view works."
             
-            # Get the topic data directly from the database - don't rely on UI state
-            topics = database.get_all_topics()
-            if not topics or len(topics) <= evt.index[0]:
-                return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), "Invalid topic selection."
-            
-            # Get the selected topic
-            selected_topic = topics[evt.index[0]]
-            topic_name = selected_topic.name
+            selected_index = evt.index[0]
+            if topic_rows and selected_index in topic_rows:
+                topic_id, topic_name = topic_rows[selected_index]
+            else:
+                # Row lookup not loaded yet - read the topics from the database
+                topics = database.get_all_topics()
+                if not topics or len(topics) <= selected_index:
+                    return _EMPTY_WORKS_DF, "Invalid topic selection."
+                topic_id, topic_name = topics[selected_index].id, topics[selected_index].name
             
-            logger.info(f"UI: Getting works for topic: {topic_name} (ID: {selected_topic.id})")
+            logger.info(f"UI: Getting works for topic: {topic_name} (ID: {topic_id})")
             
-            # Get works by topic name directly
-            works = database.get_works_by_topic(topic_name)
+            # Get works by topic name (formatted frame is cached per topic)
+            works_df, works_count = _formatted_works_by_topic(topic_name)
             
-            if not works:
-                return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), f"No works found for topic '{topic_name}'."
+            if not works_count:
+                return _EMPTY_WORKS_DF, f"No works found for topic '{topic_name}'."
             
-            return format_works_for_display(works), f"Found {len(works)} works for topic '{topic_name}'."
+            return works_df, f"Found {works_count} works for topic '{topic_name}'."
             
         except Exception as e:
             logger.error(f"UI Topic Selection Error: {e}", exc_info=True)
-            return pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"]), f"Error loading works: {str(e)}"
+            return _EMPTY_WORKS_DF, f"Error loading works: {str(e)}"
 
     return topic_selection_handler
 
 def setup_authors_tab():
     """Get the author selection handler function."""
-    def author_selection_handler(evt: gr.SelectData, authors_df_from_state: pd.DataFrame):
-        authors_df = authors_df_from_state
-        empty_works_df = pd.DataFrame(columns=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"])
+    @_memo_last_call
+    def author_selection_handler(evt: gr.SelectData, author_rows: dict, author_works_from_state: dict):
         try:
-            if authors_df is None or not isinstance(authors_df, pd.DataFrame) or authors_df.empty:
-                logger.warning("UI: author_selection_handler called with invalid or empty authors_df from state.")
-                return empty_works_df, "Author data is not available. Cannot load works."
+            if not author_rows:
+                logger.warning("UI: author_selection_handler called without author rows in state.")
+                return _EMPTY_WORKS_DF, "Author data is not available. Cannot load works."
             if evt is None or not hasattr(evt, 'index') or not evt.index:
                 logger.debug("UI: author_selection_handler called without a valid selection event.")
-                return empty_works_df, "Please select an author to view their works."
+                return _EMPTY_WORKS_DF, "Please select an author to view their works."
             selected_index = evt.index[0]
-            try:
-                if selected_index >= len(authors_df):
-                    logger.warning(f"UI: Selected index {selected_index} out of bounds for authors_df with length {len(authors_df)}.")
-                    return empty_works_df, "Invalid selection index."
-                author_id = int(authors_df.iloc[selected_index]['ID'])
-            except (IndexError, ValueError, TypeError, KeyError) as e:
-                logger.error(f"UI: Error retrieving author ID from DataFrame state. Index: {selected_index}, Df shape: {authors_df.shape}. Error: {e}", exc_info=True)
-                if selected_index < len(authors_df):
-                    logger.error(f"Problematic row data: {authors_df.iloc[selected_index]}")
-                return empty_works_df, "Could not retrieve author ID from selection."
+            if selected_index not in author_rows:
+                logger.warning(f"UI: Selected index {selected_index} out of bounds for {len(author_rows)} author rows.")
+                return _EMPTY_WORKS_DF, "Invalid selection index."
+            author_id, author_name = author_rows[selected_index]
             logger.info(f"UI: Getting works for author ID {author_id}")
-            author = database.get_author_by_id(author_id)
+            # Works prefetched by search_authors_ui need no DB access
+            if author_works_from_state and author_id in author_works_from_state:
+                works = author_works_from_state[author_id]
+                if not works:
+                    return _EMPTY_WORKS_DF, f"No works found for author '{author_name}'."
+                return format_works_for_display(works), f"Found {len(works)} works for author '{author_name}'."
+            author = _cached_author(author_id)
             if not author:
-                return empty_works_df, f"Author with ID {author_id} not found in database."
+                return _EMPTY_WORKS_DF, f"Author with ID {author_id} not found in database."
             author_name = author.name
             logger.info(f"UI: Getting works for author: {author_name} (ID: {author_id})")
-            works = database.get_works_by_author_id(author_id)
-            if not works:
-                return empty_works_df, f"No works found for author '{author_name}'."
-            return format_works_for_display(works), f"Found {len(works)} works for author '{author_name}'."
+            works_df, works_count = _formatted_works_by_author(author_id)
+            if not works_count:
+                return _EMPTY_WORKS_DF, f"No works found for author '{author_name}'."
+            return works_df, f"Found {works_count} works for author '{author_name}'."
         except Exception as e:
             logger.error(f"UI Author Selection Error: {e}", exc_info=True)
-            return empty_works_df, f"Error loading works: {str(e)}"
+            return _EMPTY_WORKS_DF, f"Error loading works: {str(e)}"
     return author_selection_handler
 
 # --- Data Management Functions ---
-def enhance_works_ui(topic: str = None, limit: int = 10):
+# The data operations below can run for minutes (network scraping, Gemini calls).
+# They are async generators: the blocking work runs on the shared UI executor
+# while a progress message is shown immediately.
+
+async def enhance_works_ui(topic: str = None, limit: int = 10):
     """UI wrapper to trigger AI enhancement."""
     logger.info(f"UI: Triggering enhancement (Topic: {topic}, Limit: {limit})")
+    yield "Enhancement in progress..."
     try:
-        ai_manager.validate_gemini_api_key()
-        count = ai_manager.enhance_existing_works(topic, limit)
-        return f"Enhancement process completed. Attempted to enhance {count} works."
+        _validate_api_key_cached()
+        count = await _run_in_background(ai_manager.enhance_existing_works, topic, limit)
+        _invalidate_ui_caches()
+        yield f"Enhancement process completed. Attempted to enhance {count} works."
     except Exception as e:
         logger.error(f"UI Enhance Error: {e}", exc_info=True)
-        return f"Error during enhancement: {e}"
+        yield f"Error during enhancement: {e}"
 
-def populate_db_ui():
+async def populate_db_ui():
     """UI wrapper to trigger database population."""
     logger.info("UI: Triggering database population with famous works")
+    yield "Populating database..."
     try:
-        # Ensure populate_db is imported correctly
-        from src import populate_db
-        result_code = populate_db.main()
+        result_code = await _run_in_background(populate_db.main)
+        _invalidate_ui_caches()
         if result_code == 0:
-            return "Database population script completed successfully. Refresh tabs to see changes."
+            yield "Database population script completed successfully. Refresh tabs to see changes."
         else:
-            return "Database population script finished with errors (check logs)."
+            yield "Database population script finished with errors (check logs)."
     except Exception as e:
         logger.error(f"UI Populate DB Error: {e}", exc_info=True)
-        return f"Error running population script: {e}"
+        yield f"Error running population script: {e}"
 
-def scrape_gutenberg_ui(query: str = "", max_works: int = 5):
+def _scrape_and_save(query: str, max_works: int) -> tuple[int, int]:
+    """Scrapes Gutenberg and saves the results. Returns (scraped, saved) counts."""
+    works = gutenberg_spider.scrape_gutenberg_batch(query=query, max_works=max_works)
+    saved_count = ai_manager.save_works_to_database(works)
+    return len(works), saved_count
+
+async def scrape_gutenberg_ui(query: str = "", max_works: int = 5):
     """UI wrapper to trigger Gutenberg scraping."""
     logger.info(f"UI: Triggering Gutenberg scrape (Query: '{query}', Max: {max_works})")
+    yield "Scraping Project Gutenberg..."
     try:
-        ai_manager.validate_gemini_api_key()
-        # Ensure gutenberg_spider is imported correctly
-        from src.scraper.spiders import gutenberg_spider
-        works = gutenberg_spider.scrape_gutenberg_batch(query=query, max_works=max_works)
-        saved_count = ai_manager.save_works_to_database(works)
-        return f"Gutenberg scraping completed. Scraped {len(works)} works, saved {saved_count} to database. Refresh tabs to see changes."
+        _validate_api_key_cached()
+        scraped_count, saved_count = await _run_in_background(_scrape_and_save, query, max_works)
+        _invalidate_ui_caches()
+        yield f"Gutenberg scraping completed. Scraped {scraped_count} works, saved {saved_count} to database. Refresh tabs to see changes."
     except Exception as e:
         logger.error(f"UI Gutenberg Scrape Error: {e}", exc_info=True)
-        return f"Error during Gutenberg scraping: {e}"
+        yield f"Error during Gutenberg scraping: {e}"
 
 # --- Gradio Interface Definition ---
-with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
+# Static styles live in assets/ui.css and are included once in the page head
+_UI_CSS_PATH = Path(__file__).parent / "assets" / "ui.css"
+
+with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base(), css_paths=[_UI_CSS_PATH]) as iface:
     gr.Markdown("# Copyright and Author Rights Explorer")
     gr.Markdown("*Explore copyright information for creative works across international jurisdictions*")
 
     # --- State Components ---
     selected_work_id_state = gr.Number(value=-1, visible=False)
-    authors_data_state = gr.State()  # State for authors data
-    topics_data_state = gr.State()   # State for topics data
+    authors_data_state = gr.State()  # Author rows: display index -> (author ID, name)
+    author_works_state = gr.State()  # Works of the found authors, keyed by author ID
+    topics_data_state = gr.State()   # Topic rows: display index -> (topic ID, name)
 
     with gr.Tabs():
         # --- Dashboard Tab ---
@@ -752,11 +1003,11 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
                 with gr.Column():
                     gr.Markdown("### Works Expiring Soon")
                     # Removed max_rows
-                    expiring_output = gr.DataFrame(label="Expiring Works", headers=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"], wrap=True)
+                    expiring_output = gr.DataFrame(label="Expiring Works", headers=list(_WORKS_COLUMNS), wrap=True)
                 with gr.Column():
                     gr.Markdown("### Public Domain Examples")
                     # Removed max_rows
-                    pd_output = gr.DataFrame(label="Public Domain Works", headers=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"], wrap=True)
+                    pd_output = gr.DataFrame(label="Public Domain Works", headers=list(_WORKS_COLUMNS), wrap=True)
 
             # Add a refresh button
             refresh_button = gr.Button("Refresh Dashboard")
@@ -773,7 +1024,7 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
                 search_button = gr.Button("Search")
 
             search_status = gr.Textbox(label="Status", interactive=False)
-            works_output = gr.DataFrame(label="Works Found", headers=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"], wrap=True, interactive=True)
+            works_output = gr.DataFrame(label="Works Found", headers=list(_WORKS_COLUMNS), wrap=True, interactive=True)
 
             # Bind the search function
             search_button.click(search_works_ui, inputs=search_input, outputs=[works_output, search_status])
@@ -793,10 +1044,14 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
             current_work_query = gr.Textbox(visible=False)
 
             # Bind the work selection event
+            # Row clicks use trigger_mode="always_last": a burst of selections while one is
+            # pending collapses into a single follow-up run for the latest row
+            # (identical repeats are already answered by _memo_last_call)
             works_output.select(
                 fn=get_work_details_ui,
                 inputs=[works_output],
-                outputs=[work_details_output, selected_work_id_state]
+                outputs=[work_details_output, selected_work_id_state],
+                trigger_mode="always_last"
             )
 
             # Bind the analysis button
@@ -814,19 +1069,19 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
                  author_search_button = gr.Button("Search")
 
             author_search_status = gr.Textbox(label="Status", interactive=False)
-            authors_output = gr.DataFrame(label="Authors Found", headers=["ID", "Name", "Birth Date", "Death Date", "Nationality"], wrap=True, interactive=True)
+            authors_output = gr.DataFrame(label="Authors Found", headers=list(_AUTHOR_COLUMNS), wrap=True, interactive=True)
 
             # Bind the author search function - NOW OUTPUTS TO STATE
             author_search_button.click(
                 search_authors_ui,
                 inputs=author_search_input,
-                outputs=[authors_output, author_search_status, authors_data_state]
+                outputs=[authors_output, author_search_status, authors_data_state, author_works_state]
             )
 
             gr.Markdown("## Works by Selected Author")
             gr.Markdown("*Select an author from the table above to view their works*")
             author_works_status = gr.Textbox(label="Status", interactive=False)
-            author_works_output = gr.DataFrame(label="Author's Works", headers=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"], wrap=True, interactive=True)
+            author_works_output = gr.DataFrame(label="Author's Works", headers=list(_WORKS_COLUMNS), wrap=True, interactive=True)
 
             # Get the author selection handler function
             author_selection_handler = setup_authors_tab()
@@ -834,8 +1089,9 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
             # Bind author selection - NOW INPUTS FROM STATE
             authors_output.select(
                 fn=author_selection_handler,
-                inputs=[authors_data_state],
-                outputs=[author_works_output, author_works_status]
+                inputs=[authors_data_state, author_works_state],
+                outputs=[author_works_output, author_works_status],
+                trigger_mode="always_last"
             )
 
             # Add work details when selecting a work by an author
@@ -844,27 +1100,28 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
             author_works_output.select(
                 fn=get_work_details_ui,
                 inputs=[author_works_output],
-                outputs=[author_work_details_output, selected_work_id_state] # Update state here too
+                outputs=[author_work_details_output, selected_work_id_state], # Update state here too
+                trigger_mode="always_last"
             )
 
         # --- Browse Topics Tab ---
         with gr.TabItem("Browse Topics", id=3):
             gr.Markdown("## Explore by Topic")
             topic_status = gr.Textbox(label="Status", interactive=False)
-            topics_output = gr.DataFrame(label="Available Topics", headers=["ID", "Name"], wrap=True, interactive=True)
+            topics_output = gr.DataFrame(label="Available Topics", headers=list(_TOPIC_COLUMNS), wrap=True, interactive=True)
 
             # Load topics when tab opens or refresh button clicked
             topics_refresh_button = gr.Button("Refresh Topics")
-            topics_refresh_button.click(initialize_topics_ui, inputs=None, outputs=[topics_output, topic_status])
+            topics_refresh_button.click(initialize_topics_ui, inputs=None, outputs=[topics_output, topic_status, topics_data_state])
 
             # Also load on UI start with the initialization function
-            iface.load(initialize_topics_ui, inputs=None, outputs=[topics_output, topic_status])
+            iface.load(initialize_topics_ui, inputs=None, outputs=[topics_output, topic_status, topics_data_state])
 
             gr.Markdown("## Works in Selected Topic")
             gr.Markdown("*Select a topic from the table above to view works*")
 
             topic_works_status = gr.Textbox(label="Status", interactive=False)
-            topic_works_output = gr.DataFrame(label="Topic Works", headers=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"], wrap=True, interactive=True)
+            topic_works_output = gr.DataFrame(label="Topic Works", headers=list(_WORKS_COLUMNS), wrap=True, interactive=True)
 
             # Get the topic selection handler function
             topic_selection_handler = setup_topics_tab()
@@ -872,7 +1129,9 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
             # Bind topic selection with the handler
             topics_output.select(
                 fn=topic_selection_handler,
-                outputs=[topic_works_output, topic_works_status]
+                inputs=[topics_data_state],
+                outputs=[topic_works_output, topic_works_status],
+                trigger_mode="always_last"
             )
             
             # Work details when selecting a work within a topic
@@ -882,7 +1141,8 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
             topic_works_output.select(
                 fn=get_work_details_ui,
                 inputs=[topic_works_output],
-                outputs=[topic_work_details_output, selected_work_id_state]
+                outputs=[topic_work_details_output, selected_work_id_state],
+                trigger_mode="always_last"
             )
 
         # --- Reports Tab ---
@@ -895,7 +1155,7 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
 
                 expiry_button = gr.Button("Generate Expiration Report")
                 expiry_status = gr.Textbox(label="Status", interactive=False)
-                expiry_report_output = gr.DataFrame(label="Works Expiring Soon", headers=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"], wrap=True)
+                expiry_report_output = gr.DataFrame(label="Works Expiring Soon", headers=list(_WORKS_COLUMNS), wrap=True)
 
                 expiry_button.click(get_upcoming_expirations_ui, inputs=None, outputs=[expiry_report_output, expiry_status])
 
@@ -905,7 +1165,7 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
 
                 pd_button = gr.Button("Generate Public Domain Report")
                 pd_status = gr.Textbox(label="Status", interactive=False)
-                pd_report_output = gr.DataFrame(label="Public Domain Works", headers=["ID", "Title", "Authors", "Topic", "Status", "Expiry Date"], wrap=True)
+                pd_report_output = gr.DataFrame(label="Public Domain Works", headers=list(_WORKS_COLUMNS), wrap=True)
 
                 pd_button.click(get_public_domain_ui, inputs=None, outputs=[pd_report_output, pd_status])
 
@@ -953,67 +1213,23 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
                 elem_id="ai_answer_box", # Keep the ID for styling
                 elem_classes=["ai-answer-output"] # Keep the class for styling
             )
-
-            # Add custom CSS to improve the AI answer display
-            gr.HTML("""
-            <style>
-                #ai_answer_box {
-                    /* Adaptable height with scrolling */
-                    max-height: 400px; /* Set a maximum height */
-                    min-height: 100px; /* Set a minimum height */
-                    overflow-y: auto; /* Add scrollbar if content exceeds max-height */
-
-                    /* Styling for better visibility */
-                    margin-top: 15px;
-                    padding: 15px;
-                    border: 1px solid #ccc; /* Slightly darker border */
-                    border-radius: 8px;
-                    background-color: #ffffff; /* Use white background for contrast with dark text */
-                    color: #333333; /* Ensure text color is dark */
-                }
-                /* Ensure nested elements inherit text color */
-                .ai-answer-output p,
-                .ai-answer-output li,
-                .ai-answer-output h1,
-                .ai-answer-output h2,
-                .ai-answer-output h3,
-                .ai-answer-output strong {
-                    color: #333333 !important; /* Force dark text color */
-                }
-                .ai-answer-output p {
-                    margin-bottom: 10px;
-                }
-                .ai-answer-output ul, .ai-answer-output ol {
-                    margin-left: 20px;
-                    margin-bottom: 10px;
-                }
-                .ai-answer-output h1, .ai-answer-output h2, .ai-answer-output h3 {
-                    margin-top: 15px;
-                    margin-bottom: 10px;
-                }
-            </style>
-            """)
             
             # Define function to update the button text
-            def set_thinking_button():
-                return gr.Button.update(value="⌛ Thinking...", interactive=False)
-            
-            def reset_button():
-                return gr.Button.update(value="Ask AI ⏎", interactive=True)
+            async def ask_ai_flow(question: str):
+                """Disables the button while the answer is generated, in a single event."""
+                yield gr.update(value="⌛ Thinking...", interactive=False), gr.update()
+                try:
+                    answer = await _run_in_background(ask_ai_about_data, question)
+                except Exception as e:
+                    logger.error(f"UI Ask AI Error: {e}", exc_info=True)
+                    answer = "Sorry, the question could not be answered. Please try again."
+                # Always re-enable the button, even when the answer failed
+                yield gr.update(value="Ask AI ⏎", interactive=True), answer
             
-            # Chain the button actions in sequence
             ai_button.click(
-                fn=set_thinking_button,
-                inputs=None,
-                outputs=ai_button
-            ).then(
-                fn=ask_ai_about_data,
+                fn=ask_ai_flow,
                 inputs=ai_question,
-                outputs=ai_answer
-            ).then(
-                fn=reset_button,
-                inputs=None,
-                outputs=ai_button
+                outputs=[ai_button, ai_answer]
             )
 
         # --- Data Management Tab (Less Prominent) ---
@@ -1028,7 +1244,9 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
                 populate_button = gr.Button("Populate with Famous Works")
                 populate_status = gr.Textbox(label="Status", interactive=False)
 
-                populate_button.click(populate_db_ui, inputs=None, outputs=populate_status)
+                # Data operations write to the database; they share one queue slot so they never overlap
+                populate_button.click(populate_db_ui, inputs=None, outputs=populate_status,
+                                      concurrency_limit=1, concurrency_id="data_ops")
 
             with gr.Tab("Scrape New Data"):
                 gr.Markdown("### Import from Gutenberg")
@@ -1041,7 +1259,8 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
                 scrape_button = gr.Button("Scrape Gutenberg")
                 scrape_status = gr.Textbox(label="Status", interactive=False)
 
-                scrape_button.click(scrape_gutenberg_ui, inputs=[scrape_query, scrape_limit], outputs=scrape_status)
+                scrape_button.click(scrape_gutenberg_ui, inputs=[scrape_query, scrape_limit], outputs=scrape_status,
+                                    concurrency_limit=1, concurrency_id="data_ops")
 
             with gr.Tab("Enhance Existing Data"):
                 gr.Markdown("### AI Enhancement")
@@ -1054,9 +1273,12 @@ with gr.Blocks(title="Author Rights Explorer", theme=gr.themes.Base()) as iface:
                 enhance_button = gr.Button("Enhance Works")
                 enhance_status = gr.Textbox(label="Status", interactive=False)
 
-                enhance_button.click(enhance_works_ui, inputs=[enhance_topic, enhance_limit], outputs=enhance_status)
+                enhance_button.click(enhance_works_ui, inputs=[enhance_topic, enhance_limit], outputs=enhance_status,
+                                     concurrency_limit=1, concurrency_id="data_ops")
 
 # --- Launch UI ---
 if __name__ == "__main__":
+    logging.config.dictConfig(LOGGING_CONFIG)
+    startup()
     logger.info("Launching Author Rights Explorer UI...")
     iface.launch(share=False, debug=True)
@@ -0,0 +1,50 @@
+# tests/conftest.py
+import os
+import shutil
+import sqlite3
+import tempfile
+
+import pytest
+
+from src import database
+from tests.fixtures import seeded_db as _seeded_db
+
+_session_db_dir = pytest.StashKey[str]()
+
+# tmpfs keeps the test database off the disk where available
+_TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+def pytest_configure(config):
+    """
+    Points the session at a copy of the database on tmpfs, so the tests never
+    write to the real file.
+    Under pytest-xdist (pytest -n auto --dist=loadfile) each worker gets its own
+    copy, so workers never contend for the same file.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker and config.getoption("numprocesses", None):
+        return  # xdist controller; the workers run the tests
+    name = worker or "main"
+    session_dir = tempfile.mkdtemp(prefix=f"copyright_data_{name}_", dir=_TMPFS_DIR)
+    session_db = os.path.join(session_dir, f"copyright_data_{name}.db")
+    if os.path.exists(database.DATABASE_PATH):
+        # The backup API includes pages still in the WAL and copies a consistent snapshot
+        source, target = sqlite3.connect(database.DATABASE_PATH), sqlite3.connect(session_db)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+    database.DATABASE_PATH = session_db
+    config.stash[_session_db_dir] = session_dir
+
+def pytest_unconfigure(config):
+    session_dir = config.stash.get(_session_db_dir, None)
+    if session_dir:
+        database.close_connection()
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+@pytest.fixture(scope="session")
+def seeded_db():
+    """Database initialized once per session; see tests/fixtures.py."""
+    return _seeded_db()
@@ -1,44 +1,64 @@
 import unittest
-import sys
 import os
 import sqlite3
+import tempfile
 from datetime import date
 import logging
 
-# Add parent directory to path to ensure imports work correctly
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from src.data_models import Work, Author, Topic, Jurisdiction
 from src import database
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Connection tuning for the test database. WAL and mmap do not apply to ":memory:";
+# the pooled connection already runs with synchronous=NORMAL.
+_TEST_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-40000",  # ~40 MB page cache
+)
+
+def _configure_pragmas(conn):
+    """Applies _TEST_PRAGMAS to a connection."""
+    for pragma in _TEST_PRAGMAS:
+        conn.execute(pragma)
+
 class TestCRUDOperations(unittest.TestCase):
     """Test cases for the database CRUD (Create, Read, Update, Delete) operations."""
     
-    def setUp(self):
-        """Set up test environment before each test."""
-        # Clear any existing data FIRST to ensure isolation
-        database.clear_database()
-        # Initialize DB schema
+    @classmethod
+    def setUpClass(cls):
+        """Create one in-memory database with schema and jurisdictions for the whole class."""
+        cls._database_path = database.DATABASE_PATH
+        # The pooled per-thread connection keeps the in-memory database alive between tests
+        database.DATABASE_PATH = ":memory:"
+        with database.get_connection() as conn:
+            _configure_pragmas(conn)
         database.init_db()
-        # Add default jurisdictions needed for tests
         database.initialize_default_jurisdictions()
-        # Get US jurisdiction for the tests
-        self.us_jurisdiction = database.get_jurisdiction_by_name("United States")
+        # Jurisdictions survive clear_database(), so look the US one up once
+        cls.us_jurisdiction = database.get_jurisdiction_by_name("United States")
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Drop the in-memory database and restore the configured path."""
+        database.close_connection()
+        database.DATABASE_PATH = cls._database_path
+    
+    def setUp(self):
+        """Set up test environment before each test."""
         # Create a test topic needed for many tests
         self.test_topic = database.add_topic("Test Topic")
     
     def tearDown(self):
         """Clean up after each test."""
-        # Clear all data from the database
+        # Clear works, authors and topics; schema and jurisdictions stay for the next test
         database.clear_database()
     
     def test_create_operations(self):
         """Test creating new records in the database."""
-        print("\nTesting CREATE operations...")
+        logger.debug("Testing CREATE operations...")
         
         # 1. Create a new author
         author = Author(
@@ -51,7 +71,7 @@ class TestCRUDOperations(unittest.TestCase):
         self.assertIsNotNone(saved_author)
         self.assertIsNotNone(saved_author.id)
         self.assertEqual(saved_author.name, "Test Author")
-        print(f"Created author: {saved_author.name}, ID: {saved_author.id}")
+        logger.debug(f"Created author: {saved_author.name}, ID: {saved_author.id}")
         
         # 2. Create a new work
         work = Work(
@@ -68,27 +88,34 @@ class TestCRUDOperations(unittest.TestCase):
         self.assertEqual(saved_work.title, "Test Work")
         self.assertEqual(len(saved_work.authors), 1)
         self.assertEqual(saved_work.authors[0].name, "Test Author")
-        print(f"Created work: {saved_work.title}, ID: {saved_work.id}")
+        logger.debug(f"Created work: {saved_work.title}, ID: {saved_work.id}")
         
         # 3. Create a new topic
         topic = database.add_topic("Another Test Topic")
         self.assertIsNotNone(topic)
         self.assertIsNotNone(topic.id)
         self.assertEqual(topic.name, "Another Test Topic")
-        print(f"Created topic: {topic.name}, ID: {topic.id}")
+        logger.debug(f"Created topic: {topic.name}, ID: {topic.id}")
         
         # Verify total count
         all_works = database.get_all_works()
         self.assertEqual(len(all_works), 1)
-        print(f"Total works in database after creation: {len(all_works)}")
+        logger.debug(f"Total works in database after creation: {len(all_works)}")
     
     def test_read_operations(self):
         """Test reading records from the database."""
-        print("\nTesting READ operations...")
+        logger.debug("Testing READ operations...")
         
         # Create some test data first
-        author1 = database.get_or_save_author(Author(name="Author One", nationality="US"))
-        author2 = database.get_or_save_author(Author(name="Author Two", nationality="GB"))
+        author1, author2 = database.get_or_save_authors_bulk([
+            Author(name="Author One", nationality="US"),
+            Author(name="Author Two", nationality="GB")
+        ])
+        # Saving the same names again returns the existing rows
+        self.assertEqual(
+            [a.id for a in database.get_or_save_authors_bulk([Author(name="Author Two"), Author(name="Author One")])],
+            [author2.id, author1.id]
+        )
         
         work1 = database.save_work(Work(
             title="Work One",
@@ -113,38 +140,51 @@ class TestCRUDOperations(unittest.TestCase):
         retrieved_work = database.get_work_by_id(work1.id)
         self.assertIsNotNone(retrieved_work)
         self.assertEqual(retrieved_work.title, "Work One")
-        print(f"Retrieved work by ID: {retrieved_work.title}")
+        logger.debug(f"Retrieved work by ID: {retrieved_work.title}")
         
         # 2. Test get_all_works
         all_works = database.get_all_works()
         self.assertEqual(len(all_works), 3)
-        print(f"Retrieved all works: {len(all_works)} works found")
+        logger.debug(f"Retrieved all works: {len(all_works)} works found")
+        
+        joined_works = database.get_all_works_with_authors()
+        self.assertEqual([w.title for w in joined_works], [w.title for w in all_works])
+        self.assertEqual([w.authors for w in joined_works], [w.authors for w in all_works])
         
         # 3. Test get_works_by_topic
         topic_works = database.get_works_by_topic("Test Topic")
         self.assertEqual(len(topic_works), 3)
-        print(f"Retrieved works by topic: {len(topic_works)} works found")
+        logger.debug(f"Retrieved works by topic: {len(topic_works)} works found")
         
         # 4. Test get_public_domain_works
         public_domain_works = database.get_public_domain_works()
         self.assertEqual(len(public_domain_works), 1)
         self.assertEqual(public_domain_works[0].title, "Work One")
-        print(f"Retrieved public domain works: {len(public_domain_works)} works found")
+        logger.debug(f"Retrieved public domain works: {len(public_domain_works)} works found")
         
         # 5. Test search_works
         search_results = database.search_works("Collaborative")
         self.assertEqual(len(search_results), 1)
         self.assertEqual(search_results[0].title, "Collaborative Work")
-        print(f"Search results for 'Collaborative': {len(search_results)} works found")
+        logger.debug(f"Search results for 'Collaborative': {len(search_results)} works found")
         
         # 6. Test searching by author
         author_search = database.search_works("Author One")
         self.assertEqual(len(author_search), 2)  # Should find Work One and Collaborative Work
-        print(f"Search results for 'Author One': {len(author_search)} works found")
+        logger.debug(f"Search results for 'Author One': {len(author_search)} works found")
+        
+        # 7. Test batched works lookup by author IDs
+        works_by_author = database.get_works_by_author_ids([author1.id, author2.id])
+        self.assertEqual(sorted(w.title for w in works_by_author[author1.id]), ["Collaborative Work", "Work One"])
+        self.assertEqual(sorted(w.title for w in works_by_author[author2.id]), ["Collaborative Work", "Work Two"])
+        collaborative = next(w for w in works_by_author[author1.id] if w.title == "Collaborative Work")
+        self.assertEqual(len(collaborative.authors), 2)
+        self.assertEqual(collaborative.topic.name, "Test Topic")
+        logger.debug(f"Batched works by author: {sum(len(v) for v in works_by_author.values())} works found")
     
     def test_update_operations(self):
         """Test updating records in the database."""
-        print("\nTesting UPDATE operations...")
+        logger.debug("Testing UPDATE operations...")
         
         # Create initial data
         author = database.get_or_save_author(Author(
@@ -168,14 +208,14 @@ class TestCRUDOperations(unittest.TestCase):
         
         self.assertEqual(updated_work.title, "Updated Title")
         self.assertEqual(updated_work.status, "Public Domain")
-        print(f"Updated work title to: {updated_work.title}, status to: {updated_work.status}")
+        logger.debug(f"Updated work title to: {updated_work.title}, status to: {updated_work.status}")
         
         # 2. Update author information
         author.death_date = date(1980, 12, 31)
         updated_author = database.get_or_save_author(author)
         
         self.assertEqual(updated_author.death_date, date(1980, 12, 31))
-        print(f"Updated author death date to: {updated_author.death_date}")
+        logger.debug(f"Updated author death date to: {updated_author.death_date}")
         
         # 3. Add additional author to work
         new_author = database.get_or_save_author(Author(
@@ -192,7 +232,7 @@ class TestCRUDOperations(unittest.TestCase):
         author_names = [a.name for a in updated_work.authors]
         self.assertIn("Original Author", author_names)
         self.assertIn("Additional Author", author_names)
-        print(f"Added additional author. Work now has {len(updated_work.authors)} authors.")
+        logger.debug(f"Added additional author. Work now has {len(updated_work.authors)} authors.")
         
         # 4. Change work's topic
         new_topic = database.add_topic("New Topic")
@@ -200,7 +240,7 @@ class TestCRUDOperations(unittest.TestCase):
         updated_work = database.save_work(work)
         
         self.assertEqual(updated_work.topic.name, "New Topic")
-        print(f"Updated work topic to: {updated_work.topic.name}")
+        logger.debug(f"Updated work topic to: {updated_work.topic.name}")
         
         # Verify updates persisted
         retrieved_work = database.get_work_by_id(work.id)
@@ -208,15 +248,17 @@ class TestCRUDOperations(unittest.TestCase):
         self.assertEqual(retrieved_work.status, "Public Domain")
         self.assertEqual(retrieved_work.topic.name, "New Topic")
         self.assertEqual(len(retrieved_work.authors), 2)
-        print("All updates successfully persisted in the database")
+        logger.debug("All updates successfully persisted in the database")
     
     def test_delete_operations(self):
         """Test deleting records from the database."""
-        print("\nTesting DELETE operations...")
+        logger.debug("Testing DELETE operations...")
         
         # Create test data
-        author1 = database.get_or_save_author(Author(name="Delete Test Author 1"))
-        author2 = database.get_or_save_author(Author(name="Delete Test Author 2"))
+        author1, author2 = database.get_or_save_authors_bulk([
+            Author(name="Delete Test Author 1"),
+            Author(name="Delete Test Author 2")
+        ])
         
         work1 = database.save_work(Work(
             title="Delete Test Work 1",
@@ -233,26 +275,26 @@ class TestCRUDOperations(unittest.TestCase):
         # Verify works were created
         all_works_before = database.get_all_works()
         self.assertEqual(len(all_works_before), 2)
-        print(f"Initial works count: {len(all_works_before)}")
+        logger.debug(f"Initial works count: {len(all_works_before)}")
         
         # Delete works and verify - use proper delete_work function
         success = database.delete_work(work1.id)
         self.assertTrue(success)
         all_works_after_first_delete = database.get_all_works()
         self.assertEqual(len(all_works_after_first_delete), 1)
-        print(f"Work count after first delete: {len(all_works_after_first_delete)}")
+        logger.debug(f"Work count after first delete: {len(all_works_after_first_delete)}")
         
         success = database.delete_work(work2.id)
         self.assertTrue(success)
         all_works_after_second_delete = database.get_all_works()
         self.assertEqual(len(all_works_after_second_delete), 0)
-        print(f"Work count after second delete: {len(all_works_after_second_delete)}")
+        logger.debug(f"Work count after second delete: {len(all_works_after_second_delete)}")
         
         # Clear entire database
         database.clear_database()
         all_works_after_clear = database.get_all_works()
         self.assertEqual(len(all_works_after_clear), 0)
-        print("Database cleared successfully")
+        logger.debug("Database cleared successfully")
     
     def _delete_work(self, work_id):
         """
@@ -263,31 +305,31 @@ class TestCRUDOperations(unittest.TestCase):
     
     def test_bulk_operations(self):
         """Test bulk operations for creating and retrieving multiple works."""
-        print("\nTesting bulk operations...")
+        logger.debug("Testing bulk operations...")
         
-        # Create test data for bulk insert
+        # Create test data for bulk insert (dates given as date objects, no parsing needed)
         bulk_data = [
             {
                 "title": "Bulk Work 1",
-                "authors": [{"name": "Bulk Author 1", "birth_date": "1800-01-01", "death_date": "1880-12-31"}],
-                "creation_date": "1870-05-10",
+                "authors": [{"name": "Bulk Author 1", "birth_date": date(1800, 1, 1), "death_date": date(1880, 12, 31)}],
+                "creation_date": date(1870, 5, 10),
                 "status": "Public Domain",
                 "primary_jurisdiction": self.us_jurisdiction
             },
             {
                 "title": "Bulk Work 2",
-                "authors": [{"name": "Bulk Author 2", "birth_date": "1900-03-15", "death_date": "1980-07-22"}],
-                "creation_date": "1950-11-30",
+                "authors": [{"name": "Bulk Author 2", "birth_date": date(1900, 3, 15), "death_date": date(1980, 7, 22)}],
+                "creation_date": date(1950, 11, 30),
                 "status": "Copyrighted",
                 "primary_jurisdiction": self.us_jurisdiction
             },
             {
                 "title": "Bulk Work 3",
                 "authors": [
-                    {"name": "Bulk Author 3", "birth_date": "1910-06-20", "death_date": "1990-02-14"},
-                    {"name": "Bulk Author 4", "birth_date": "1912-08-05", "death_date": "1995-04-30"}
+                    {"name": "Bulk Author 3", "birth_date": date(1910, 6, 20), "death_date": date(1990, 2, 14)},
+                    {"name": "Bulk Author 4", "birth_date": date(1912, 8, 5), "death_date": date(1995, 4, 30)}
                 ],
-                "creation_date": "1960-09-25",
+                "creation_date": date(1960, 9, 25),
                 "status": "Copyrighted",
                 "primary_jurisdiction": self.us_jurisdiction
             }
@@ -299,7 +341,7 @@ class TestCRUDOperations(unittest.TestCase):
         count = database.add_famous_works(topic_name, bulk_data)
         
         self.assertEqual(count, 3)
-        print(f"Bulk inserted {count} works")
+        logger.debug(f"Bulk inserted {count} works")
         
         # Verify all works were added
         all_works = database.get_all_works()
@@ -308,14 +350,157 @@ class TestCRUDOperations(unittest.TestCase):
         # Verify works by topic
         topic_works = database.get_works_by_topic(topic_name)
         self.assertEqual(len(topic_works), 3)
-        print(f"Retrieved {len(topic_works)} works from topic '{topic_name}'")
+        logger.debug(f"Retrieved {len(topic_works)} works from topic '{topic_name}'")
         
         # Verify a collaborative work was correctly added with multiple authors
         collaborative_works = [w for w in all_works if len(w.authors) > 1]
         self.assertEqual(len(collaborative_works), 1)
         self.assertEqual(len(collaborative_works[0].authors), 2)
-        print(f"Verified collaborative work with {len(collaborative_works[0].authors)} authors")
+        logger.debug(f"Verified collaborative work with {len(collaborative_works[0].authors)} authors")
+        
+        # Bulk save Work objects in one batch, reusing an existing author
+        saved = database.save_works_bulk([
+            Work(title="Bulk Work 4", authors=[Author(name="Bulk Author 1")], topic=self.test_topic,
+                 creation_date=date(1875, 1, 1), status="Public Domain", primary_jurisdiction=self.us_jurisdiction),
+            Work(title="Bulk Work 5", authors=[Author(name="Bulk Author 5"), Author(name="Bulk Author 2")],
+                 topic=self.test_topic, status="Copyrighted"),
+        ])
+        self.assertTrue(all(w and w.id for w in saved))
+        self.assertEqual(saved[1].id, saved[0].id + 1)
+        
+        retrieved_work = database.get_work_by_id(saved[1].id)
+        self.assertEqual(retrieved_work.title, "Bulk Work 5")
+        self.assertEqual(retrieved_work.topic.name, "Test Topic")
+        self.assertEqual(sorted(a.name for a in retrieved_work.authors), ["Bulk Author 2", "Bulk Author 5"])
+        self.assertEqual(database.get_work_by_id(saved[0].id).authors[0].death_date, date(1880, 12, 31))
+        self.assertEqual(database.count_works(), 5)
+        self.assertEqual(database.count_authors(), 5)
+
+        # Two new works sharing a source_url: the later one updates the first
+        saved = database.save_works_bulk([
+            Work(title="Bulk Work 6", authors=[Author(name="Bulk Author 6")], source_url="https://example.com/6"),
+            Work(title="Bulk Work 6 (revised)", authors=[Author(name="Bulk Author 6")], source_url="https://example.com/6"),
+        ])
+        self.assertTrue(all(w and w.id for w in saved))
+        self.assertEqual(saved[0].id, saved[1].id)
+        self.assertEqual(database.get_work_by_id(saved[0].id).title, "Bulk Work 6 (revised)")
+        self.assertEqual(database.count_works(), 6)
+
+    def test_count_operations(self):
+        """Test the aggregate count queries used by the dashboard."""
+        logger.debug("Testing COUNT operations...")
+        
+        self.assertFalse(database.has_any_works())
+        author = database.get_or_save_author(Author(name="Count Author"))
+        database.save_work(Work(title="Count Work 1", authors=[author], topic=self.test_topic, status="Public Domain"))
+        database.save_work(Work(title="Count Work 2", authors=[author], topic=self.test_topic, status="Copyrighted"))
+        database.save_work(Work(title="Count Work 3", authors=[author], topic=self.test_topic, status="Public Domain"))
+        
+        self.assertTrue(database.has_any_works())
+        self.assertEqual(database.count_works(), 3)
+        self.assertEqual(database.count_authors(), 1)
+        self.assertEqual(database.count_topics(), 1)
+        self.assertEqual(database.count_jurisdictions(), len(database.get_all_jurisdictions()))
+        self.assertEqual(database.count_works_by_status(), {"Public Domain": 2, "Copyrighted": 1})
+        
+        sample = database.get_random_public_domain_works(limit=5)
+        self.assertEqual(len(sample), 2)
+        self.assertTrue(all(w.status == "Public Domain" for w in sample))
+        logger.debug(f"Counted {database.count_works()} works by status: {database.count_works_by_status()}")
+    
+    def test_ai_cache_operations(self):
+        """Test storing and retrieving cached AI responses."""
+        logger.debug("Testing AI cache operations...")
+
+        key = "work_analysis:test"
+        self.assertIsNone(database.get_cached_ai_response("work_analysis:missing"))
+
+        self.assertTrue(database.save_cached_ai_response(key, "First answer"))
+        self.assertEqual(database.get_cached_ai_response(key), "First answer")
+
+        # Saving again under the same key replaces the previous answer
+        self.assertTrue(database.save_cached_ai_response(key, "Second answer"))
+        self.assertEqual(database.get_cached_ai_response(key), "Second answer")
+
+        # Responses older than max_age are treated as missing
+        self.assertEqual(database.get_cached_ai_response(key, max_age=3600), "Second answer")
+        self.assertIsNone(database.get_cached_ai_response(key, max_age=-1))
+        logger.debug("Cached AI response stored and replaced successfully")
+
+    def test_data_version(self):
+        """Test that data changes bump the data version and AI cache writes do not."""
+        logger.debug("Testing data version...")
+
+        version = database.get_data_version()
+        database.save_cached_ai_response("work_analysis:version", "Answer")
+        self.assertEqual(database.get_data_version(), version)
+
+        database.add_topic("Data Version Topic")
+        self.assertGreater(database.get_data_version(), version)
+        logger.debug(f"Data version moved from {version} to {database.get_data_version()}")
+
+    def test_transaction_operations(self):
+        """Test grouping several writes into one transaction."""
+        logger.debug("Testing transaction operations...")
+
+        with database.transaction():
+            database.add_topic("Transaction Topic A")
+            database.add_topic("Transaction Topic B")
+        self.assertIsNotNone(database.get_topic_by_name("Transaction Topic A"))
+        self.assertIsNotNone(database.get_topic_by_name("Transaction Topic B"))
+
+        # An error inside the block discards every write made in it
+        with self.assertRaises(RuntimeError):
+            with database.transaction():
+                database.add_topic("Transaction Topic C")
+                raise RuntimeError("abort batch")
+        self.assertIsNone(database.get_topic_by_name("Transaction Topic C"))
+
+        # Nested reads leave the caller's row factory in place
+        with database.get_connection() as conn:
+            conn.row_factory = database.dict_factory
+            database.get_all_topics()
+            database.get_all_authors()
+            database.get_all_works_with_authors()
+            database.get_works_by_topic("Test Topic")
+            database.get_works_by_author_ids([1])
+            self.assertIs(conn.row_factory, database.dict_factory)
+        logger.debug("Transaction committed and rolled back as expected")
+
+class TestConnectionPool(unittest.TestCase):
+    """Test cases for the per-thread pooled connection."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Use a temporary database file; WAL mode does not apply to in-memory databases."""
+        cls._database_path = database.DATABASE_PATH
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        database.DATABASE_PATH = os.path.join(cls._temp_dir.name, "pool_test.db")
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Close the pooled connection and remove the temporary database."""
+        database.close_connection()
+        database.DATABASE_PATH = cls._database_path
+        cls._temp_dir.cleanup()
+    
+    def test_connection_reuse(self):
+        """Test that a thread reuses one WAL-mode connection across calls."""
+        logger.debug("Testing connection reuse...")
+
+        with database.get_connection() as first:
+            pass
+        with database.get_connection() as second:
+            journal_mode = second.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertIs(first, second)
+        self.assertEqual(journal_mode.lower(), "wal")
+        logger.debug("Connection reused in WAL mode")
 
 if __name__ == "__main__":
     print(f"Running CRUD operation tests at {date.today().isoformat()}")
-    unittest.main()
\ No newline at end of file
+    # Run test methods in declaration order (create -> read -> update -> delete)
+    # rather than unittest's default alphabetical order; pytest already does this.
+    declared = {name: i for cls in (TestCRUDOperations, TestConnectionPool) for i, name in enumerate(vars(cls))}
+    loader = unittest.TestLoader()
+    loader.sortTestMethodsUsing = lambda a, b: declared[a] - declared[b]
+    unittest.main(testLoader=loader)
\ No newline at end of file
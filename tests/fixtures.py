@@ -0,0 +1,27 @@
+# tests/fixtures.py
+"""Shared, read-only database fixtures for the scheduler test modules."""
+from collections import namedtuple
+from functools import lru_cache
+
+from src import database
+
+SeededDB = namedtuple("SeededDB", "jurisdictions works")
+
+@lru_cache(maxsize=None)
+def _load_seeded_db(database_path: str) -> SeededDB:
+    database.init_db()
+    database.initialize_default_jurisdictions()
+    return SeededDB(
+        jurisdictions=tuple(database.get_all_jurisdictions()),
+        works=tuple(database.get_all_works_with_authors()),
+    )
+
+def seeded_db() -> SeededDB:
+    """
+    Initializes the configured database once and returns its jurisdictions and works.
+    The snapshot is cached per database path for the rest of the test session;
+    call seeded_db.cache_clear() after writing to the database.
+    """
+    return _load_seeded_db(database.DATABASE_PATH)
+
+seeded_db.cache_clear = _load_seeded_db.cache_clear
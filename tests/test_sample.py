@@ -1,18 +1,19 @@
 import unittest
-import sys
-import os
 from unittest.mock import patch, MagicMock
+from dataclasses import replace
 from datetime import date
 import io
 import time
+from array import array
 
-# Fix imports by adding the parent directory to the path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-# Now imports should work properly
 from src.data_models import Work, Author, Jurisdiction, CopyrightRule, Topic
 from src import scheduler
 from src import database
+from tests.fixtures import seeded_db
+
+# Outcome codes stored in DetailedTestResult._outcomes
+PASS, FAIL, ERROR, SKIP = range(4)
+_OUTCOME_LABELS = ('PASS', 'FAIL', 'ERROR', 'SKIP')
 
 # --- Custom Test Result Class ---
 class DetailedTestResult(unittest.TextTestResult):
@@ -26,55 +27,56 @@ class DetailedTestResult(unittest.TextTestResult):
         self.failure_count = 0
         self.error_count = 0
         self.skipped_count = 0
-        self.test_results = []
-        self.execution_time = {}
+        # Per-test results as parallel columns; error info/skip reasons keyed by index.
+        # Only the test id and docstring are kept, so finished TestCase objects can be freed.
+        self._test_ids = []
+        self._test_docs = []
+        self._outcomes = array('b')
+        self._elapsed_ns = array('q')
+        self._details = {}
+        # Tests run one at a time, so a single start timestamp is enough.
+        # Per-test timings are only reported (and measured) at verbosity >= 2.
+        self._timed = verbosity >= 2
+        self._start_ns = None
+    
+    def _record(self, test, outcome, detail=None):
+        """Appends one result; elapsed is 0 for class-level skips/errors."""
+        elapsed_ns = 0 if self._start_ns is None else time.perf_counter_ns() - self._start_ns
+        if detail is not None:
+            self._details[len(self._test_ids)] = detail
+        self._test_ids.append(test.id())
+        self._test_docs.append(getattr(test, '_testMethodDoc', None))
+        self._outcomes.append(outcome)
+        self._elapsed_ns.append(elapsed_ns)
     
     def startTest(self, test):
         super(DetailedTestResult, self).startTest(test)
-        self.execution_time[test] = time.time()
+        if self._timed:
+            self._start_ns = time.perf_counter_ns()
+    
+    def stopTest(self, test):
+        super(DetailedTestResult, self).stopTest(test)
+        self._start_ns = None
     
     def addSuccess(self, test):
         super(DetailedTestResult, self).addSuccess(test)
         self.success_count += 1
-        execution_time = time.time() - self.execution_time[test]
-        self.test_results.append({
-            'test': test,
-            'result': 'PASS',
-            'execution_time': execution_time
-        })
-    
+        self._record(test, PASS)
+
     def addFailure(self, test, err):
         super(DetailedTestResult, self).addFailure(test, err)
         self.failure_count += 1
-        execution_time = time.time() - self.execution_time[test]
-        self.test_results.append({
-            'test': test,
-            'result': 'FAIL',
-            'error': err,
-            'execution_time': execution_time
-        })
-    
+        self._record(test, FAIL, err)
+
     def addError(self, test, err):
         super(DetailedTestResult, self).addError(test, err)
         self.error_count += 1
-        execution_time = time.time() - self.execution_time[test]
-        self.test_results.append({
-            'test': test,
-            'result': 'ERROR',
-            'error': err,
-            'execution_time': execution_time
-        })
-    
+        self._record(test, ERROR, err)
+
     def addSkip(self, test, reason):
         super(DetailedTestResult, self).addSkip(test, reason)
         self.skipped_count += 1
-        execution_time = time.time() - self.execution_time[test]
-        self.test_results.append({
-            'test': test,
-            'result': 'SKIP',
-            'reason': reason,
-            'execution_time': execution_time
-        })
+        self._record(test, SKIP, reason)
     
     def printDetailedReport(self):
         self.stream.writeln("\n=== DETAILED TEST REPORT ===")
@@ -89,25 +91,26 @@ class DetailedTestResult(unittest.TextTestResult):
         # Print individual test results
         self.stream.writeln("\n--- Individual Test Results ---")
         
-        for result in self.test_results:
-            test = result['test']
-            test_name = test.id().split('.')[-1]
-            test_class = test.id().split('.')[-2]
-            execution_time = result['execution_time']
+        for i, (test_id, test_doc, outcome, elapsed_ns) in enumerate(
+                zip(self._test_ids, self._test_docs, self._outcomes, self._elapsed_ns)):
+            test_name = test_id.split('.')[-1]
+            test_class = test_id.split('.')[-2]
+            timing = f" ({elapsed_ns * 1e-9:.3f}s)" if self._timed else ""
+            detail = self._details.get(i)
             
-            # Get the test docstring (description)
-            test_doc = test._testMethodDoc if test._testMethodDoc else "No description provided"
+            # Test docstring (description)
+            test_doc = test_doc or "No description provided"
             
-            self.stream.writeln(f"\n{test_class}.{test_name} ({execution_time:.3f}s): {result['result']}")
+            self.stream.writeln(f"\n{test_class}.{test_name}{timing}: {_OUTCOME_LABELS[outcome]}")
             self.stream.writeln(f"Description: {test_doc}")
             
-            if result['result'] == 'FAIL' or result['result'] == 'ERROR':
+            if outcome in (FAIL, ERROR):
                 self.stream.writeln("Error:")
-                err_type, err_value, _ = result['error']
+                err_type, err_value, _ = detail
                 self.stream.writeln(f"{err_type.__name__}: {err_value}")
             
-            if result['result'] == 'SKIP':
-                self.stream.writeln(f"Reason: {result['reason']}")
+            if outcome == SKIP:
+                self.stream.writeln(f"Reason: {detail}")
 
 class DetailedTestRunner(unittest.TextTestRunner):
     """Custom TestRunner that uses DetailedTestResult to generate detailed reports."""
@@ -128,21 +131,18 @@ class DetailedTestRunner(unittest.TextTestRunner):
         return result
 
 # --- Basic tests that use the real database ---
+@unittest.skipIf(not database.has_any_works(), "No works found in database.")
 class TestSchedulerBasic(unittest.TestCase):
     """Test basic scheduler module functionality with real database."""
     
-    def setUp(self):
-        """Set up test data."""
-        # Get some jurisdictions to test with
-        self.jurisdictions = database.get_all_jurisdictions()
-        self.works = database.get_all_works()
+    @classmethod
+    def setUpClass(cls):
+        """Load test data once; these tests only read the database."""
+        # Shared with the other scheduler tests; loaded once per session
+        cls.jurisdictions, cls.works = seeded_db()
         
     def test_calculate_standard_expiry(self):
         """Test standard copyright expiry calculation."""
-        # Ensure we have works to test with
-        if not self.works:
-            self.skipTest("No works found in database.")
-            
         # Test with each work
         for work in self.works[:3]:  # Use at most 3 works to keep it manageable
             if work.authors and any(a.death_date for a in work.authors):
@@ -155,10 +155,6 @@ class TestSchedulerBasic(unittest.TestCase):
     
     def test_apply_special_rules(self):
         """Test the application of special copyright rules."""
-        # Ensure we have works to test with
-        if not self.works:
-            self.skipTest("No works found in database.")
-            
         # Find a jurisdiction with special rules
         jurisdictions_with_rules = [j for j in self.jurisdictions if j.has_special_rules]
         if not jurisdictions_with_rules:
@@ -173,10 +169,6 @@ class TestSchedulerBasic(unittest.TestCase):
     
     def test_calculate_expiry(self):
         """Test the main expiry calculation function."""
-        # Ensure we have works to test with
-        if not self.works:
-            self.skipTest("No works found in database.")
-            
         # Test with each work
         for work in self.works[:3]:  # Use at most 3 works to keep it manageable
             # Test with each jurisdiction
@@ -187,10 +179,6 @@ class TestSchedulerBasic(unittest.TestCase):
     
     def test_determine_status(self):
         """Test determining copyright status."""
-        # Ensure we have works to test with
-        if not self.works:
-            self.skipTest("No works found in database.")
-            
         # Test with each work
         for work in self.works[:3]:  # Use at most 3 works to keep it manageable
             # Test global status
@@ -206,17 +194,12 @@ class TestSchedulerBasic(unittest.TestCase):
     
     def test_update_work_status(self):
         """Test updating a work's copyright status."""
-        # Ensure we have works to test with
-        if not self.works:
-            self.skipTest("No works found in database.")
-            
-        # Test with one work
-        if self.works:
-            work = self.works[0]
-            updated_work = scheduler.update_work_status(work)
-            self.assertIsInstance(updated_work, Work, f"update_work_status didn't return a Work object")
-            self.assertIn(updated_work.status, ['Public Domain', 'Copyrighted', 'Unknown'], 
-                         f"update_work_status set an unexpected status: {updated_work.status}")
+        # Test with one work (copied so the shared fixture work is not modified)
+        work = replace(self.works[0])
+        updated_work = scheduler.update_work_status(work)
+        self.assertIsInstance(updated_work, Work, f"update_work_status didn't return a Work object")
+        self.assertIn(updated_work.status, ['Public Domain', 'Copyrighted', 'Unknown'], 
+                     f"update_work_status set an unexpected status: {updated_work.status}")
 
 if __name__ == '__main__':
     # Use our custom test runner instead of the default
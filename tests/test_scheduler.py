@@ -1,23 +1,28 @@
 # tests/test_scheduler.py
 import unittest
-import sys
-import os
 import logging
 import time
+from array import array
+from dataclasses import replace
 from datetime import date, timedelta
+from functools import lru_cache
+from itertools import groupby, product
+from operator import attrgetter
+from types import MappingProxyType
 from typing import List, Dict
 
-# Fix imports by adding the parent directory to the path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-# Now imports should work properly
 from src.data_models import Work, Author, Jurisdiction, CopyrightRule, Topic
 from src import scheduler
 from src import database
+from tests.fixtures import seeded_db
 
 # --- Disable Logging During Tests ---
 logging.disable(logging.CRITICAL)
 
+# Outcome codes stored in DetailedTestResult._outcomes
+PASS, FAIL, ERROR, SKIP = range(4)
+_OUTCOME_LABELS = ('PASS', 'FAIL', 'ERROR', 'SKIP')
+
 # --- Custom Test Result Class ---
 class DetailedTestResult(unittest.TextTestResult):
     """Custom TestResult class that provides more detailed output for each test."""
@@ -30,59 +35,56 @@ class DetailedTestResult(unittest.TextTestResult):
         self.failure_count = 0
         self.error_count = 0
         self.skipped_count = 0
-        self.test_results = []
-        self.execution_time = {}
+        # Per-test results as parallel columns; error info/skip reasons keyed by index.
+        # Only the test id and docstring are kept, so finished TestCase objects can be freed.
+        self._test_ids = []
+        self._test_docs = []
+        self._outcomes = array('b')
+        self._elapsed_ns = array('q')
+        self._details = {}
+        # Tests run one at a time, so a single start timestamp is enough.
+        # Per-test timings are only reported (and measured) at verbosity >= 2.
+        self._timed = verbosity >= 2
+        self._start_ns = None
+    
+    def _record(self, test, outcome, detail=None):
+        """Appends one result; elapsed is 0 for class-level skips/errors."""
+        elapsed_ns = 0 if self._start_ns is None else time.perf_counter_ns() - self._start_ns
+        if detail is not None:
+            self._details[len(self._test_ids)] = detail
+        self._test_ids.append(test.id())
+        self._test_docs.append(getattr(test, '_testMethodDoc', None))
+        self._outcomes.append(outcome)
+        self._elapsed_ns.append(elapsed_ns)
     
     def startTest(self, test):
         super(DetailedTestResult, self).startTest(test)
-        self.execution_time[test] = time.time()
+        if self._timed:
+            self._start_ns = time.perf_counter_ns()
+    
+    def stopTest(self, test):
+        super(DetailedTestResult, self).stopTest(test)
+        self._start_ns = None
     
     def addSuccess(self, test):
         super(DetailedTestResult, self).addSuccess(test)
         self.success_count += 1
-        start_time = self.execution_time.get(test) # Use .get()
-        execution_time = time.time() - start_time if start_time else 0.0 # Handle None
-        self.test_results.append({
-            'test': test,
-            'result': 'PASS',
-            'execution_time': execution_time
-        })
+        self._record(test, PASS)
 
     def addFailure(self, test, err):
         super(DetailedTestResult, self).addFailure(test, err)
         self.failure_count += 1
-        start_time = self.execution_time.get(test) # Use .get()
-        execution_time = time.time() - start_time if start_time else 0.0 # Handle None
-        self.test_results.append({
-            'test': test,
-            'result': 'FAIL',
-            'error': err,
-            'execution_time': execution_time
-        })
+        self._record(test, FAIL, err)
 
     def addError(self, test, err):
         super(DetailedTestResult, self).addError(test, err)
         self.error_count += 1
-        start_time = self.execution_time.get(test) # Use .get()
-        execution_time = time.time() - start_time if start_time else 0.0 # Handle None
-        self.test_results.append({
-            'test': test,
-            'result': 'ERROR',
-            'error': err,
-            'execution_time': execution_time
-        })
+        self._record(test, ERROR, err)
 
     def addSkip(self, test, reason):
         super(DetailedTestResult, self).addSkip(test, reason)
         self.skipped_count += 1
-        start_time = self.execution_time.get(test) # Use .get()
-        execution_time = time.time() - start_time if start_time else 0.0 # Handle None
-        self.test_results.append({
-            'test': test,
-            'result': 'SKIP',
-            'reason': reason,
-            'execution_time': execution_time
-        })
+        self._record(test, SKIP, reason)
     
     def printDetailedReport(self):
         self.stream.writeln("\n=== DETAILED TEST REPORT ===")
@@ -97,36 +99,34 @@ class DetailedTestResult(unittest.TextTestResult):
         # Print individual test results
         self.stream.writeln("\n--- Individual Test Results ---")
         
-        for result in self.test_results:
-            test = result['test']
-            execution_time = result['execution_time']
+        for i, (test_id, test_doc, outcome, elapsed_ns) in enumerate(
+                zip(self._test_ids, self._test_docs, self._outcomes, self._elapsed_ns)):
+            timing = f" ({elapsed_ns * 1e-9:.3f}s)" if self._timed else ""
+            detail = self._details.get(i)
 
-            # Safely get test name and class
-            test_id = getattr(test, 'id', lambda: 'Unknown Test')() # Use getattr for safety
+            # Test name and class
             test_name = test_id.split('.')[-1]
             test_class = test_id.split('.')[-2] if '.' in test_id else 'UnknownClass'
 
-            # Get the test docstring (description)
-            test_doc = getattr(test, '_testMethodDoc', "No description provided or Class Setup/TearDown")
-            if not test_doc: # Handle empty string docstrings
-                test_doc = "No description provided or Class Setup/TearDown"
+            # Test docstring (description); class-level setup/teardown errors have none
+            test_doc = test_doc or "No description provided or Class Setup/TearDown"
                 
-            self.stream.writeln(f"\n{test_class}.{test_name} ({execution_time:.3f}s): {result['result']}")
+            self.stream.writeln(f"\n{test_class}.{test_name}{timing}: {_OUTCOME_LABELS[outcome]}")
             self.stream.writeln(f"Description: {test_doc}")
 
-            if result['result'] == 'FAIL' or result['result'] == 'ERROR':
+            if outcome in (FAIL, ERROR):
                 self.stream.writeln("Error:")
                 # Check if error info is a tuple (expected format)
-                if isinstance(result.get('error'), tuple) and len(result['error']) >= 2:
-                    err_type, err_value = result['error'][:2]
+                if isinstance(detail, tuple) and len(detail) >= 2:
+                    err_type, err_value = detail[:2]
                     err_name = getattr(err_type, '__name__', 'UnknownErrorType')
                     self.stream.writeln(f"{err_name}: {err_value}")
                 else:
-                    self.stream.writeln(f"Unexpected error format: {result.get('error')}")
+                    self.stream.writeln(f"Unexpected error format: {detail}")
 
 
-            if result['result'] == 'SKIP':
-                self.stream.writeln(f"Reason: {result.get('reason', 'No reason provided')}") # Use .get()
+            if outcome == SKIP:
+                self.stream.writeln(f"Reason: {detail or 'No reason provided'}")
 
 class DetailedTestRunner(unittest.TextTestRunner):
     """Custom TestRunner that uses DetailedTestResult to generate detailed reports."""
@@ -149,17 +149,35 @@ class DetailedTestRunner(unittest.TextTestRunner):
 # Current date for consistent testing
 TODAY = date(2025, 4, 29)
 
+# Fixture lookups filled in setUpClass. Several tests check the same
+# (work, jurisdiction) pairs, so the scheduler results are memoized per pair.
+_works_by_id: Dict[int, Work] = {}
+_jurisdictions_by_id: Dict[int, Jurisdiction] = {}
+
+def _group_works(works, key) -> MappingProxyType:
+    """Groups works into a read-only {key(work): tuple of works} map, keys in sorted order."""
+    ordered = sorted(works, key=lambda work: str(key(work)))
+    return MappingProxyType({k: tuple(group) for k, group in groupby(ordered, key)})
+
+@lru_cache(maxsize=None)
+def _status(work_id: int, jurisdiction_id: int = None) -> str:
+    """determine_status at TODAY; jurisdiction_id=None gives the global status."""
+    return scheduler.determine_status(_works_by_id[work_id], _jurisdictions_by_id.get(jurisdiction_id),
+                                      current_date=TODAY)
+
+@lru_cache(maxsize=None)
+def _expiry(work_id: int, jurisdiction_id: int):
+    """calculate_expiry for a fixture work and jurisdiction."""
+    return scheduler.calculate_expiry(_works_by_id[work_id], _jurisdictions_by_id[jurisdiction_id])
+
 class TestSchedulerMethods(unittest.TestCase):
     """Test all methods in the scheduler module using actual database content."""
 
     @classmethod
     def setUpClass(cls):
         """Initialize database connection and ensure data exists for all tests."""
-        # Initialize DB schema and default jurisdictions first
-        database.init_db()
-        database.initialize_default_jurisdictions()
-
-        cls.works = database.get_all_works()
+        # Initialize DB schema and default jurisdictions once per session
+        cls.jurisdictions, cls.works = seeded_db()
 
         # If database is empty, add minimal sample data needed for scheduler tests
         if not cls.works:
@@ -181,14 +199,12 @@ class TestSchedulerMethods(unittest.TestCase):
                 work3 = Work(title="Rule of Shorter Term", authors=[author1], topic=book_topic, creation_date=date(1950, 1, 1), first_publication_date=date(1950,1,1)) # US 1923-1977
                 work4 = Work(title="Unknown Date Work", authors=[author_unknown], topic=movie_topic) # Unknown status
 
-                # Add works to DB using save_work
-                database.save_work(work1) # Changed from add_work
-                database.save_work(work2) # Changed from add_work
-                database.save_work(work3) # Changed from add_work
-                database.save_work(work4) # Changed from add_work
+                # Add works to DB in one batch (single transaction)
+                database.save_works_bulk([work1, work2, work3, work4])
 
                 # Re-fetch works after adding sample data
-                cls.works = database.get_all_works()
+                seeded_db.cache_clear()
+                cls.jurisdictions, cls.works = seeded_db()
                 print(f"INFO: Added {len(cls.works)} sample works.")
 
             except Exception as e:
@@ -199,40 +215,30 @@ class TestSchedulerMethods(unittest.TestCase):
         if not cls.works:
             # If still no works after trying to add, something is fundamentally wrong
             raise RuntimeError("Database is still empty after attempting to add sample data.")
-
-        cls.jurisdictions = database.get_all_jurisdictions()
-
         
-        # Ensure we have at least some works in the database
-        if not cls.works:
-            raise unittest.SkipTest("No works found in database. Tests need actual works to run.")
+        _works_by_id.clear()
+        _works_by_id.update((work.id, work) for work in cls.works)
+        _jurisdictions_by_id.clear()
+        _jurisdictions_by_id.update((j.id, j) for j in cls.jurisdictions)
+        _status.cache_clear()
+        _expiry.cache_clear()
         
-        # Save references to different work types for easier testing
-        cls.works_by_status = {}
-        cls.works_by_jurisdiction = {}
-        cls.works_by_type = {}
+        # Save references to different work types for easier testing (read-only views)
+        cls.works_by_status = _group_works(cls.works, attrgetter('status'))
+        cls.works_by_jurisdiction = _group_works(
+            (w for w in cls.works if w.primary_jurisdiction), attrgetter('primary_jurisdiction.code'))
+        cls.works_by_type = _group_works((w for w in cls.works if w.topic), attrgetter('topic.name'))
         
-        # Categorize works for testing
+        # Subsets used by the calculate_standard_expiry tests
+        with_deceased_authors = []
+        with_creation_only = []
         for work in cls.works:
-            # By status
-            status = work.status
-            if status not in cls.works_by_status:
-                cls.works_by_status[status] = []
-            cls.works_by_status[status].append(work)
-            
-            # By primary jurisdiction
-            if work.primary_jurisdiction:
-                jur_code = work.primary_jurisdiction.code
-                if jur_code not in cls.works_by_jurisdiction:
-                    cls.works_by_jurisdiction[jur_code] = []
-                cls.works_by_jurisdiction[jur_code].append(work)
-            
-            # By type (topic)
-            if work.topic:
-                topic_name = work.topic.name
-                if topic_name not in cls.works_by_type:
-                    cls.works_by_type[topic_name] = []
-                cls.works_by_type[topic_name].append(work)
+            if any(a.death_date for a in work.authors):
+                with_deceased_authors.append(work)
+            elif work.creation_date:
+                with_creation_only.append(work)
+        cls.works_with_deceased_authors = tuple(with_deceased_authors)
+        cls.works_with_creation_only = tuple(with_creation_only)
         
         print(f"Found {len(cls.works)} works, {len(cls.jurisdictions)} jurisdictions in database")
         print(f"Works by status: {', '.join(f'{k}: {len(v)}' for k, v in cls.works_by_status.items())}")
@@ -255,15 +261,10 @@ class TestSchedulerMethods(unittest.TestCase):
     def test_calculate_standard_expiry_with_author_death(self):
         """Test standard expiry calculation based on author death date."""
         # Find a work with an author with death date
-        works_with_deceased_authors = []
-        for work in self.works:
-            if work.authors and any(a.death_date for a in work.authors):
-                works_with_deceased_authors.append(work)
-        
-        if not works_with_deceased_authors:
+        if not self.works_with_deceased_authors:
             self.skipTest("No works with deceased authors found in database.")
         
-        work = works_with_deceased_authors[0]  # Take the first one
+        work = self.works_with_deceased_authors[0]  # Take the first one
         last_author_death = max(a.death_date for a in work.authors if a.death_date)
         
         # Get a jurisdiction with a known term_years_after_death
@@ -282,15 +283,10 @@ class TestSchedulerMethods(unittest.TestCase):
     def test_calculate_standard_expiry_with_creation_date(self):
         """Test standard expiry calculation based on creation date."""
         # Find a work with creation date but no author death dates
-        works_with_creation = []
-        for work in self.works:
-            if work.creation_date and not any(a.death_date for a in work.authors):
-                works_with_creation.append(work)
-        
-        if not works_with_creation:
+        if not self.works_with_creation_only:
             self.skipTest("No works with creation date but no author death dates found.")
         
-        work = works_with_creation[0]  # Take the first one
+        work = self.works_with_creation_only[0]  # Take the first one
         
         # Get a jurisdiction with a known term_years_after_death
         jurisdiction = next((j for j in self.jurisdictions if j.term_years_after_death), None)
@@ -345,12 +341,11 @@ class TestSchedulerMethods(unittest.TestCase):
     # --- Test calculate_expiry ---
     def test_calculate_expiry(self):
         """Test the main expiry calculation function."""
-        # Test with each work
-        for work in self.works:
-            # Test with each jurisdiction
-            for jurisdiction in self.jurisdictions:
+        # Test with each work in each jurisdiction
+        for work, jurisdiction in product(self.works, self.jurisdictions):
+            with self.subTest(work=work.title, jurisdiction=jurisdiction.code):
                 # Run the calculation
-                expiry = scheduler.calculate_expiry(work, jurisdiction)
+                expiry = _expiry(work.id, jurisdiction.id)
                 
                 # Check that it returns a date or None
                 self.assertTrue(expiry is None or isinstance(expiry, date))
@@ -360,20 +355,20 @@ class TestSchedulerMethods(unittest.TestCase):
         """Test determining copyright status (Public Domain, Copyrighted, Unknown)."""
         # Test with each work
         for work in self.works:
-            # Run the status determination
-            status = scheduler.determine_status(work, current_date=TODAY)
-            
-            # Check that it returns a valid status
-            self.assertIn(status, ['Public Domain', 'Copyrighted', 'Unknown'])
+            with self.subTest(work=work.title):
+                # Run the status determination
+                status = _status(work.id)
+                
+                # Check that it returns a valid status
+                self.assertIn(status, ['Public Domain', 'Copyrighted', 'Unknown'])
     
     def test_determine_status_with_jurisdiction(self):
         """Test determining copyright status for a specific jurisdiction."""
-        # Test with each work
-        for work in self.works:
-            # Test with each jurisdiction
-            for jurisdiction in self.jurisdictions:
+        # Test with each work in each jurisdiction
+        for work, jurisdiction in product(self.works, self.jurisdictions):
+            with self.subTest(work=work.title, jurisdiction=jurisdiction.code):
                 # Run the status determination
-                status = scheduler.determine_status(work, jurisdiction, current_date=TODAY)
+                status = _status(work.id, jurisdiction.id)
                 
                 # Check that it returns a valid status
                 self.assertIn(status, ['Public Domain', 'Copyrighted', 'Unknown'])
@@ -383,34 +378,23 @@ class TestSchedulerMethods(unittest.TestCase):
         """Test calculating status across multiple jurisdictions."""
         # Test with each work
         for work in self.works:
-            # Run the multi-jurisdiction status calculation
-            status_map = scheduler.calculate_multi_jurisdiction_status(work, self.jurisdictions)
-            
-            # Check that it returns a dictionary with correct keys and values
-            self.assertIsInstance(status_map, dict)
-            for jur_code, status in status_map.items():
-                self.assertIn(status, ['Public Domain', 'Copyrighted', 'Unknown'])
-                self.assertTrue(any(j.code == jur_code for j in self.jurisdictions))
+            with self.subTest(work=work.title):
+                # Run the multi-jurisdiction status calculation
+                status_map = scheduler.calculate_multi_jurisdiction_status(work, self.jurisdictions)
+                
+                # Check that it returns a dictionary with correct keys and values
+                self.assertIsInstance(status_map, dict)
+                for jur_code, status in status_map.items():
+                    self.assertIn(status, ['Public Domain', 'Copyrighted', 'Unknown'])
+                    self.assertTrue(any(j.code == jur_code for j in self.jurisdictions))
     
     # --- Test update_work_status ---
     def test_update_work_status(self):
         """Test updating a work's copyright status."""
         # Test with each work
         for work in self.works:
-            # Make a copy of the work to not modify the original
-            work_copy = Work(
-                id=work.id,
-                title=work.title,
-                authors=work.authors.copy() if work.authors else [],
-                topic=work.topic,
-                creation_date=work.creation_date,
-                first_publication_date=work.first_publication_date,
-                source_url=work.source_url,
-                copyright_expiry_date=None,  # Clear these for testing
-                status="Unknown",  # Clear these for testing
-                primary_jurisdiction=work.primary_jurisdiction,
-                status_by_jurisdiction={}  # Clear these for testing
-            )
+            # Shallow copy with the status fields cleared, so the shared fixture is not modified
+            work_copy = replace(work, copyright_expiry_date=None, status="Unknown", status_by_jurisdiction={})
             
             # Run the update
             updated_work = scheduler.update_work_status(work_copy)
@@ -435,30 +419,32 @@ class TestSchedulerMethods(unittest.TestCase):
                 self.assertIsInstance(days, int)
             
             # Validate the result matches the status
-            status = scheduler.determine_status(work, current_date=TODAY)
+            status = _status(work.id)
             if status == 'Public Domain':
                 self.assertIsNone(days, "Public Domain work should return None for days until expiry")
     
     # --- Test get_works_by_status_in_jurisdiction ---
     def test_get_works_by_status_in_jurisdiction(self):
         """Test filtering works by status in a jurisdiction."""
-        # Test with each jurisdiction
-        for jurisdiction in self.jurisdictions:
-            if not jurisdiction.code:
-                continue
-                
-            # Test with each status
-            for status in ['Public Domain', 'Copyrighted', 'Unknown']:
+        jurisdictions = [j for j in self.jurisdictions if j.code]
+        
+        # Test with each status in each jurisdiction
+        for jurisdiction, status in product(jurisdictions, ['Public Domain', 'Copyrighted', 'Unknown']):
+            with self.subTest(jurisdiction=jurisdiction.code, status=status):
                 # Run the filter
                 filtered_works = scheduler.get_works_by_status_in_jurisdiction(jurisdiction.code, status)
                 
                 # Check that it returns a list
                 self.assertIsInstance(filtered_works, list)
                 
-                # Check that all returned works have the requested status in this jurisdiction
+                # Check that all returned works have the requested status in this jurisdiction.
+                # Fixture works use the memoized status; any other work is computed directly.
                 for work in filtered_works:
-                    work_status = scheduler.determine_status(work, jurisdiction, current_date=TODAY)
-                    self.assertEqual(work_status, status)
+                    if work.id in _works_by_id:
+                        work_status = _status(work.id, jurisdiction.id)
+                    else:
+                        work_status = scheduler.determine_status(work, jurisdiction, current_date=TODAY)
+                    self.assertEqual(work_status, status, f"Work {work.id} ({work.title!r})")
 
 if __name__ == '__main__':
     # Use our custom test runner